@@ -59,14 +59,24 @@ class PipelineStep(BaseModel):
         None,
         description="Function that maps previous step's result to this step's parameters",
     )
+    parallel_group: Optional[int] = Field(
+        None,
+        description="Consecutive steps sharing this id run concurrently on the same input",
+    )
 
-    @model_validator(mode="after")
-    def _check_skill_reference(self) -> "PipelineStep":
-        if self.skill_name is None and self.skill is None:
-            raise ValueError("Either 'skill_name' or 'skill' must be provided")
-        if self.skill_name is not None and self.skill is not None:
-            raise ValueError("Provide either 'skill_name' or 'skill', not both")
-        return self
+    @model_validator(mode="before")
+    @classmethod
+    def _check_skill_reference(cls, data: Any) -> Any:
+        # Plain dict check on the raw input: rejects bad steps before any
+        # field validation runs.
+        if isinstance(data, dict):
+            has_name = data.get("skill_name") is not None
+            has_skill = data.get("skill") is not None
+            if not has_name and not has_skill:
+                raise ValueError("Either 'skill_name' or 'skill' must be provided")
+            if has_name and has_skill:
+                raise ValueError("Provide either 'skill_name' or 'skill', not both")
+        return data
 
 
 class StepResult(BaseModel):
@@ -1,6 +1,8 @@
 """Skill Pipeline for composing skills sequentially."""
 
-import time
+import asyncio
+import sys
+from time import perf_counter_ns
 from typing import Any, Optional
 
 from .models import (
@@ -8,6 +10,7 @@ from .models import (
     PipelineResult,
     PipelineStep,
     SkillInput,
+    SkillOutput,
     StepResult,
 )
 from .registry import SkillRegistry
@@ -21,6 +24,9 @@ class SkillPipeline:
     mapper function. If no mapper is provided, the previous step's result
     dict is passed through as-is as the next step's parameters.
 
+    Independent steps can share a ``parallel_group`` to run concurrently
+    (useful for fan-out over I/O-bound skills).
+
     Example::
 
         pipeline = (
@@ -39,18 +45,36 @@ class SkillPipeline:
         self,
         registry: Optional[SkillRegistry] = None,
         name: str = "pipeline",
+        max_concurrency: int = 0,
     ) -> None:
+        """Create a pipeline.
+
+        Args:
+            registry: Registry used to resolve steps added by ``skill_name``.
+            name: Pipeline name reported in result metadata.
+            max_concurrency: Upper bound on steps of one parallel group running
+                at the same time; 0 means unbounded.
+        """
+        if max_concurrency < 0:
+            raise ValueError("max_concurrency must be >= 0")
         self._registry = registry
         self._name = name
+        self._max_concurrency = max_concurrency
         self._steps: list[PipelineStep] = []
+        # Read-only snapshot handed out by ``steps``; rebuilt after add_step().
+        self._steps_view: Optional[tuple[PipelineStep, ...]] = None
+        # Skill resolved for each step, filled lazily on first execute().
+        self._resolved: list[Optional[Skill]] = []
 
     @property
     def name(self) -> str:
         return self._name
 
     @property
-    def steps(self) -> list[PipelineStep]:
-        return list(self._steps)
+    def steps(self) -> tuple[PipelineStep, ...]:
+        if self._steps_view is None:
+            self._steps_view = tuple(self._steps)
+        return self._steps_view
 
     def __len__(self) -> int:
         return len(self._steps)
@@ -62,17 +86,34 @@ class SkillPipeline:
         skill_name: Optional[str] = None,
         action: str,
         mapper: Optional[ParameterMapper] = None,
+        parallel_group: Optional[int] = None,
     ) -> "SkillPipeline":
-        """Add a step to the pipeline. Returns self for fluent chaining."""
+        """Add a step to the pipeline. Returns self for fluent chaining.
+
+        Consecutive steps given the same ``parallel_group`` run concurrently.
+        """
         step = PipelineStep(
             skill=skill,
-            skill_name=skill_name,
-            action=action,
+            # Interned so registry lookups and action dispatch compare by identity.
+            skill_name=sys.intern(skill_name) if skill_name is not None else None,
+            action=sys.intern(action),
             mapper=mapper,
+            parallel_group=parallel_group,
         )
         self._steps.append(step)
+        self._steps_view = None
+        self._resolved.append(skill)
         return self
 
+    def invalidate_cache(self) -> None:
+        """Forget registry lookups so the next execute() resolves skills again.
+
+        Steps that reference a skill by name are looked up once and then
+        reused. Call this after registering or unregistering skills that the
+        pipeline refers to.
+        """
+        self._resolved = [step.skill for step in self._steps]
+
     def _resolve_skill(self, step: PipelineStep) -> Skill:
         """Resolve a PipelineStep to a concrete Skill instance."""
         if step.skill is not None:
@@ -85,14 +126,40 @@ class SkillPipeline:
             )
         return self._registry.get(step.skill_name)  # type: ignore[arg-type]
 
+    async def _run_skill(
+        self,
+        skill: Skill,
+        action: str,
+        parameters: dict[str, Any],
+        context: Optional[dict[str, Any]],
+    ) -> SkillOutput:
+        """Run one skill, skipping the SkillInput round trip when possible."""
+        if type(skill).execute is not Skill.execute:
+            # Honour subclasses that customise execute() itself.
+            return await skill.execute(
+                SkillInput.model_construct(action=action, parameters=parameters, context=context)
+            )
+        return skill._to_output(await skill._execute_raw(action, parameters, context))
+
     async def execute(
         self,
         initial_parameters: Optional[dict[str, Any]] = None,
         context: Optional[dict[str, Any]] = None,
     ) -> PipelineResult:
-        """Execute the pipeline sequentially. Stops on first error."""
+        """Execute the pipeline sequentially. Stops on first error.
+
+        Consecutive steps that share a ``parallel_group`` all receive the
+        same input and run concurrently; the last step of the group feeds
+        the step after it.
+
+        Results are passed between steps as-is, not copied: skills and mappers
+        must treat the parameters they receive as read-only.
+
+        Every model built here is populated from values the pipeline already
+        owns, so they are created with ``model_construct`` to skip re-validation.
+        """
         if not self._steps:
-            return PipelineResult(
+            return PipelineResult.model_construct(
                 success=True,
                 final_result=None,
                 error=None,
@@ -100,110 +167,130 @@ class SkillPipeline:
                 metadata=self._build_metadata(0.0, 0, 0, []),
             )
 
-        pipeline_start = time.time()
+        pipeline_start_ns = perf_counter_ns()
+        step_count = len(self._steps)
         step_results: list[StepResult] = []
+        per_step_times: list[dict[str, Any]] = []
         current_params = initial_parameters or {}
+        # Created per run: on Python 3.9 a Semaphore binds to the running loop.
+        semaphore = asyncio.Semaphore(self._max_concurrency) if self._max_concurrency else None
 
-        for index, step in enumerate(self._steps):
-            # 1. Resolve skill
-            try:
-                resolved_skill = self._resolve_skill(step)
-            except (ValueError, KeyError) as e:
-                pipeline_time = (time.time() - pipeline_start) * 1000
-                return PipelineResult(
-                    success=False,
-                    steps=step_results,
-                    final_result=None,
-                    error=f"Step {index}: Failed to resolve skill: {e}",
-                    failed_step=index,
-                    metadata=self._build_metadata(
-                        pipeline_time, len(self._steps), index, step_results
-                    ),
-                )
+        async def run_limited(skill: Skill, action: str, params: dict[str, Any]) -> SkillOutput:
+            if semaphore is None:
+                return await self._run_skill(skill, action, params, context)
+            async with semaphore:
+                return await self._run_skill(skill, action, params, context)
+
+        def fail(index: int, error: str, steps_executed: int) -> PipelineResult:
+            pipeline_time = (perf_counter_ns() - pipeline_start_ns) / 1_000_000
+            return PipelineResult.model_construct(
+                success=False,
+                steps=step_results,
+                final_result=None,
+                error=error,
+                failed_step=index,
+                metadata=self._build_metadata(
+                    pipeline_time, step_count, steps_executed, per_step_times
+                ),
+            )
 
-            # 2. Map parameters
-            if step.mapper is not None:
+        for group in self._groups():
+            calls: list[tuple[int, Skill, str, dict[str, Any]]] = []
+            for index in group:
+                step = self._steps[index]
+
+                # 1. Resolve skill
                 try:
-                    mapped_params = step.mapper(current_params)
-                except Exception as e:
-                    pipeline_time = (time.time() - pipeline_start) * 1000
-                    return PipelineResult(
-                        success=False,
-                        steps=step_results,
-                        final_result=None,
-                        error=f"Step {index}: Mapper function failed: {e}",
-                        failed_step=index,
-                        metadata=self._build_metadata(
-                            pipeline_time, len(self._steps), index, step_results
-                        ),
-                    )
+                    resolved_skill = self._resolved[index] or self._resolve_skill(step)
+                except (ValueError, KeyError) as e:
+                    return fail(index, f"Step {index}: Failed to resolve skill: {e}", group[0])
+                self._resolved[index] = resolved_skill
+
+                # 2. Map parameters
+                if step.mapper is not None:
+                    try:
+                        mapped_params = step.mapper(current_params)
+                    except Exception as e:
+                        return fail(index, f"Step {index}: Mapper function failed: {e}", group[0])
+                else:
+                    mapped_params = current_params
+
+                calls.append((index, resolved_skill, step.action, mapped_params))
+
+            # 3. Execute skill(s)
+            if len(calls) == 1:
+                _, skill, action, params = calls[0]
+                if not skill._async_process and type(skill).execute is Skill.execute:
+                    # Plain synchronous skill: no coroutine to create or await.
+                    outputs = [skill._to_output(skill._process_raw(action, params))]
+                else:
+                    outputs = [await self._run_skill(skill, action, params, context)]
             else:
-                mapped_params = current_params
+                outputs = await asyncio.gather(
+                    *(run_limited(skill, action, params) for _, skill, action, params in calls)
+                )
 
-            # 3. Execute skill
-            skill_input = SkillInput(
-                action=step.action,
-                parameters=mapped_params,
-                context=context,
-            )
-            output = await resolved_skill.execute(skill_input)
-
-            # 4. Record step result
-            step_result = StepResult(
-                step_index=index,
-                skill_name=resolved_skill.name,
-                action=step.action,
-                output=output,
-            )
-            step_results.append(step_result)
+            # 4. Record step results
+            for (index, skill, action, _), output in zip(calls, outputs):
+                step_results.append(
+                    StepResult.model_construct(
+                        step_index=index,
+                        skill_name=skill.name,
+                        action=action,
+                        output=output,
+                    )
+                )
+                per_step_times.append(
+                    {
+                        "step_index": index,
+                        "skill_name": skill.name,
+                        "action": action,
+                        "execution_time_ms": output.metadata.get("execution_time_ms", 0.0),
+                    }
+                )
 
             # 5. Fail-fast
-            if not output.success:
-                pipeline_time = (time.time() - pipeline_start) * 1000
-                return PipelineResult(
-                    success=False,
-                    steps=step_results,
-                    final_result=None,
-                    error=(
-                        f"Step {index} ({resolved_skill.name}/{step.action}) failed: {output.error}"
-                    ),
-                    failed_step=index,
-                    metadata=self._build_metadata(
-                        pipeline_time, len(self._steps), index + 1, step_results
-                    ),
-                )
+            for (index, skill, action, _), output in zip(calls, outputs):
+                if not output.success:
+                    return fail(
+                        index,
+                        f"Step {index} ({skill.name}/{action}) failed: {output.error}",
+                        group[-1] + 1,
+                    )
 
             # 6. Feed result forward
-            current_params = output.result or {}
+            current_params = outputs[-1].result or {}
 
-        pipeline_time = (time.time() - pipeline_start) * 1000
-        return PipelineResult(
+        pipeline_time = (perf_counter_ns() - pipeline_start_ns) / 1_000_000
+        return PipelineResult.model_construct(
             success=True,
             steps=step_results,
             final_result=current_params,
             error=None,
             failed_step=None,
-            metadata=self._build_metadata(
-                pipeline_time, len(self._steps), len(self._steps), step_results
-            ),
+            metadata=self._build_metadata(pipeline_time, step_count, step_count, per_step_times),
         )
 
+    def _groups(self) -> list[list[int]]:
+        """Split step indices into runs of consecutive steps sharing a parallel_group."""
+        groups: list[list[int]] = []
+        previous: Optional[int] = None
+        for index, step in enumerate(self._steps):
+            group = step.parallel_group
+            if groups and group is not None and group == previous:
+                groups[-1].append(index)
+            else:
+                groups.append([index])
+            previous = group
+        return groups
+
     def _build_metadata(
         self,
         total_time_ms: float,
         step_count: int,
         steps_executed: int,
-        step_results: list[StepResult],
+        per_step_times: list[dict[str, Any]],
     ) -> dict[str, Any]:
-        per_step_times = [
-            {
-                "step_index": sr.step_index,
-                "skill_name": sr.skill_name,
-                "action": sr.action,
-                "execution_time_ms": sr.output.metadata.get("execution_time_ms", 0.0),
-            }
-            for sr in step_results
-        ]
         return {
             "pipeline_name": self._name,
             "total_execution_time_ms": total_time_ms,
@@ -227,6 +314,7 @@ class SkillPipeline:
                     "skill": name,
                     "action": step.action,
                     "has_mapper": step.mapper is not None,
+                    "parallel_group": step.parallel_group,
                 }
             )
         return {
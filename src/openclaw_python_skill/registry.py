@@ -1,6 +1,9 @@
 """Skill Registry for OpenClaw Python Skills."""
 
+import bisect
+import sys
 import threading
+from collections.abc import Iterable
 from typing import Any, Optional
 
 from .skill import Skill
@@ -23,8 +26,16 @@ class SkillRegistry:
     """
 
     def __init__(self) -> None:
+        # Copy-on-write: writers publish a new dict under the lock and never
+        # mutate a published one, so readers can use it without locking.
         self._skills: dict[str, Skill] = {}
         self._lock = threading.Lock()
+        # Names kept in sorted order by the writers (also copy-on-write), so
+        # skill_names() never sorts.
+        self._sorted_names: list[str] = []
+        # Metadata listing stored with the snapshot it came from. A new
+        # snapshot makes it stale without any explicit reset.
+        self._meta_cache: Optional[tuple[dict[str, Skill], list[dict[str, Any]]]] = None
 
     def register(self, skill: Skill) -> None:
         """Register a skill instance.
@@ -36,15 +47,38 @@ class SkillRegistry:
             TypeError: If skill is not a Skill instance.
             ValueError: If a skill with the same name is already registered.
         """
-        if not isinstance(skill, Skill):
-            raise TypeError(f"Expected a Skill instance, got {type(skill).__name__}")
+        self.register_many((skill,))
+
+    def register_many(self, skills: Iterable[Skill]) -> None:
+        """Register several skill instances at once.
+
+        Every skill is checked before any is added, and the lock is taken
+        once, so a failure leaves the registry unchanged.
+
+        Args:
+            skills: Skill instances to register.
+
+        Raises:
+            TypeError: If any item is not a Skill instance.
+            ValueError: If a name is already registered or appears twice in skills.
+        """
+        batch = list(skills)
+        for skill in batch:
+            if not isinstance(skill, Skill):
+                raise TypeError(f"Expected a Skill instance, got {type(skill).__name__}")
         with self._lock:
-            if skill.name in self._skills:
-                raise ValueError(
-                    f"Skill '{skill.name}' is already registered. "
-                    "Unregister it first or use a different name."
-                )
-            self._skills[skill.name] = skill
+            added: dict[str, Skill] = {}
+            for skill in batch:
+                if skill.name in self._skills or skill.name in added:
+                    raise ValueError(
+                        f"Skill '{skill.name}' is already registered. "
+                        "Unregister it first or use a different name."
+                    )
+                # Interned keys let lookups with the same literal match by identity.
+                added[sys.intern(skill.name)] = skill
+            # Both runs are already sorted, so this is a linear merge.
+            self._sorted_names = sorted([*self._sorted_names, *sorted(added)])
+            self._skills = {**self._skills, **added}
 
     def unregister(self, name: str) -> Skill:
         """Remove and return a skill by name.
@@ -61,7 +95,13 @@ class SkillRegistry:
         with self._lock:
             if name not in self._skills:
                 raise KeyError(f"No skill registered with name '{name}'")
-            return self._skills.pop(name)
+            skills = dict(self._skills)
+            removed = skills.pop(name)
+            names = list(self._sorted_names)
+            del names[bisect.bisect_left(names, name)]
+            self._sorted_names = names
+            self._skills = skills
+            return removed
 
     def get(self, name: str) -> Skill:
         """Look up a skill by name.
@@ -75,10 +115,10 @@ class SkillRegistry:
         Raises:
             KeyError: If no skill with the given name is registered.
         """
-        with self._lock:
-            if name not in self._skills:
-                raise KeyError(f"No skill registered with name '{name}'")
+        try:
             return self._skills[name]
+        except KeyError:
+            raise KeyError(f"No skill registered with name '{name}'") from None
 
     def has(self, name: str) -> bool:
         """Check whether a skill is registered.
@@ -89,8 +129,7 @@ class SkillRegistry:
         Returns:
             True if a skill with the given name is registered.
         """
-        with self._lock:
-            return name in self._skills
+        return name in self._skills
 
     def list_skills(self) -> list[dict[str, Any]]:
         """List all registered skills with their metadata.
@@ -98,22 +137,25 @@ class SkillRegistry:
         Returns:
             A list of skill metadata dictionaries (from Skill.describe()).
         """
-        with self._lock:
-            return [skill.describe() for skill in self._skills.values()]
+        skills = self._skills
+        cached = self._meta_cache
+        if cached is None or cached[0] is not skills:
+            cached = (skills, [skill.describe() for skill in skills.values()])
+            self._meta_cache = cached
+        return [dict(meta) for meta in cached[1]]
 
     def skill_names(self) -> list[str]:
         """Return a sorted list of all registered skill names."""
-        with self._lock:
-            return sorted(self._skills.keys())
+        return list(self._sorted_names)
 
     def clear(self) -> None:
         """Remove all registered skills."""
         with self._lock:
-            self._skills.clear()
+            self._sorted_names = []
+            self._skills = {}
 
     def __len__(self) -> int:
-        with self._lock:
-            return len(self._skills)
+        return len(self._skills)
 
     def __contains__(self, name: object) -> bool:
         if not isinstance(name, str):
@@ -158,18 +200,11 @@ class SkillRegistry:
 
 # --- Global singleton ---
 
-_global_registry: Optional[SkillRegistry] = None
-_global_lock = threading.Lock()
+# Created at import time: module imports are serialized, so there is no
+# initialization race and no lock or None-check on every lookup.
+_global_registry = SkillRegistry()
 
 
 def get_global_registry() -> SkillRegistry:
-    """Return the global shared SkillRegistry instance.
-
-    Creates it on first call (thread-safe lazy initialization).
-    """
-    global _global_registry
-    if _global_registry is None:
-        with _global_lock:
-            if _global_registry is None:
-                _global_registry = SkillRegistry()
+    """Return the global shared SkillRegistry instance."""
     return _global_registry
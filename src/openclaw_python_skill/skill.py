@@ -1,19 +1,42 @@
 """Base Skill class for OpenClaw Python Skills."""
 
-import time
 from abc import ABC, abstractmethod
-from typing import Any
+from time import perf_counter_ns
+from typing import Any, Optional
 
 from .models import SkillInput, SkillOutput
 
+# (success, result, error, execution_time_ms) as returned by Skill._execute_raw
+RawResult = tuple[bool, Optional[dict[str, Any]], Optional[str], float]
+
 
 class Skill(ABC):
     """Base class for OpenClaw Python Skills.
 
     Subclass this to create custom skills that integrate with OpenClaw.
     Implement the `process` method to define your skill's behavior.
+
+    I/O-bound skills may also override `aprocess`; `execute` then awaits it
+    instead of calling `process`, so several calls can overlap on the loop.
+
+    Skills whose `process` can never raise may set ``raises = False`` to run
+    without the error-handling wrapper; any exception then propagates out
+    of `execute` instead of becoming a failed SkillOutput.
     """
 
+    # Subclasses that add no instance attributes can declare ``__slots__ = ()``
+    # to stay dict-free.
+    __slots__ = ("name", "version", "_meta_base", "_description")
+
+    raises: bool = True
+
+    # True when a subclass overrides aprocess; set by __init_subclass__.
+    _async_process: bool = False
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._async_process = cls.aprocess is not Skill.aprocess
+
     def __init__(self, name: str, version: str = "1.0.0"):
         """Initialize the skill.
 
@@ -23,6 +46,9 @@ class Skill(ABC):
         """
         self.name = name
         self.version = version
+        # Static part of every SkillOutput.metadata, built once per skill.
+        self._meta_base = {"skill": name, "version": version}
+        self._description: Optional[dict[str, Any]] = None
 
     @abstractmethod
     def process(self, action: str, parameters: dict[str, Any]) -> dict[str, Any]:
@@ -40,6 +66,14 @@ class Skill(ABC):
         """
         raise NotImplementedError
 
+    async def aprocess(self, action: str, parameters: dict[str, Any]) -> dict[str, Any]:
+        """Asynchronous variant of `process`.
+
+        Override this in skills that wait on I/O. The default just calls
+        `process`, and `execute` skips it unless a subclass overrides it.
+        """
+        return self.process(action=action, parameters=parameters)
+
     async def execute(self, skill_input: SkillInput) -> SkillOutput:
         """Execute a skill with timing and error handling.
 
@@ -49,36 +83,74 @@ class Skill(ABC):
         Returns:
             SkillOutput with result or error information
         """
-        start_time = time.time()
+        raw = await self._execute_raw(
+            skill_input.action, skill_input.parameters, skill_input.context
+        )
+        return self._to_output(raw)
+
+    async def _execute_raw(
+        self,
+        action: str,
+        parameters: dict[str, Any],
+        context: Optional[dict[str, Any]] = None,
+    ) -> RawResult:
+        """Run `process` (or `aprocess`) with timing and error handling, without building models.
+
+        Used by `execute` and directly by SkillPipeline, which wraps the
+        result itself and so does not need an intermediate SkillInput/SkillOutput.
+
+        Returns:
+            Tuple of (success, result, error, execution_time_ms)
+        """
+        if not self._async_process:
+            return self._process_raw(action, parameters)
+
+        start_ns = perf_counter_ns()
+
+        if not self.raises:
+            result = await self.aprocess(action, parameters)
+            return True, result, None, (perf_counter_ns() - start_ns) / 1_000_000
+
+        try:
+            result = await self.aprocess(action, parameters)
+            if result is not None and not isinstance(result, dict):
+                raise TypeError(f"process() must return a dict, got {type(result).__name__}")
+        except Exception as e:
+            return False, None, str(e), (perf_counter_ns() - start_ns) / 1_000_000
+
+        return True, result, None, (perf_counter_ns() - start_ns) / 1_000_000
+
+    def _process_raw(self, action: str, parameters: dict[str, Any]) -> RawResult:
+        """Synchronous `_execute_raw` for skills that do not override `aprocess`.
+
+        SkillPipeline calls this directly for such skills, so a step never
+        creates or awaits a coroutine.
+        """
+        start_ns = perf_counter_ns()
+
+        if not self.raises:
+            result = self.process(action=action, parameters=parameters)
+            return True, result, None, (perf_counter_ns() - start_ns) / 1_000_000
 
         try:
-            result = self.process(action=skill_input.action, parameters=skill_input.parameters)
-
-            execution_time_ms = (time.time() - start_time) * 1000
-
-            return SkillOutput(
-                success=True,
-                result=result,
-                error=None,
-                metadata={
-                    "execution_time_ms": execution_time_ms,
-                    "skill": self.name,
-                    "version": self.version,
-                },
-            )
+            result = self.process(action=action, parameters=parameters)
+            if result is not None and not isinstance(result, dict):
+                raise TypeError(f"process() must return a dict, got {type(result).__name__}")
         except Exception as e:
-            execution_time_ms = (time.time() - start_time) * 1000
-
-            return SkillOutput(
-                success=False,
-                result=None,
-                error=str(e),
-                metadata={
-                    "execution_time_ms": execution_time_ms,
-                    "skill": self.name,
-                    "version": self.version,
-                },
-            )
+            return False, None, str(e), (perf_counter_ns() - start_ns) / 1_000_000
+
+        return True, result, None, (perf_counter_ns() - start_ns) / 1_000_000
+
+    def _to_output(self, raw: RawResult) -> SkillOutput:
+        """Wrap an `_execute_raw` tuple in a SkillOutput."""
+        success, result, error, execution_time_ms = raw
+        # Fields are produced here, not by the caller, so skip Pydantic validation.
+        return SkillOutput.model_construct(
+            success=success,
+            result=result,
+            error=error,
+            metadata={"execution_time_ms": execution_time_ms, **self._meta_base},
+        )
 
     def describe(self) -> dict[str, Any]:
         """Describe the skill for OpenClaw integration.
@@ -86,8 +158,10 @@ class Skill(ABC):
         Returns:
             Skill metadata dictionary
         """
-        return {
-            "name": self.name,
-            "version": self.version,
-            "description": self.__class__.__doc__ or "",
-        }
+        if self._description is None:
+            self._description = {
+                "name": self.name,
+                "version": self.version,
+                "description": self.__class__.__doc__ or "",
+            }
+        return dict(self._description)
@@ -1,8 +1,34 @@
 """Skills for OpenClaw Python Skills package."""
 
-from .math_skill import MathSkill
-from .text_analyzer import TextAnalyzerSkill
-from .web_fetch import WebFetchSkill
-from .web_scraper import WebScraperSkill
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .math_skill import MathSkill
+    from .text_analyzer import TextAnalyzerSkill
+    from .web_fetch import WebFetchSkill
+    from .web_scraper import WebScraperSkill
+
+# Skills are imported on first attribute access (PEP 562), so using one skill
+# does not pay for the others' dependencies, e.g. httpx for the web skills.
+_LAZY_IMPORTS = {
+    "MathSkill": ".math_skill",
+    "TextAnalyzerSkill": ".text_analyzer",
+    "WebFetchSkill": ".web_fetch",
+    "WebScraperSkill": ".web_scraper",
+}
 
 __all__ = ["MathSkill", "TextAnalyzerSkill", "WebFetchSkill", "WebScraperSkill"]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value  # later lookups skip __getattr__
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *__all__])
@@ -0,0 +1,83 @@
+"""Per-skill TTL cache for HTTP responses, shared by the web skills."""
+
+from collections.abc import Hashable, Mapping
+from time import monotonic
+from typing import Optional
+
+import httpx
+
+# Statuses saying the resource is not there, as opposed to a failed request.
+_NEGATIVE_STATUSES = frozenset({404, 410, 451})
+
+
+def _max_age(response: httpx.Response) -> Optional[float]:
+    """Return how long the server allows caching, or None if it doesn't say.
+
+    ``no-store`` and ``no-cache`` count as 0: this cache never revalidates.
+    """
+    max_age = None
+    for directive in response.headers.get("cache-control", "").split(","):
+        name, _, value = directive.strip().lower().partition("=")
+        if name in ("no-store", "no-cache"):
+            return 0.0
+        if name == "max-age":
+            try:
+                max_age = float(value.strip('"'))
+            except ValueError:
+                return 0.0
+    return max_age
+
+
+class ResponseCache:
+    """Keep successful responses for ``ttl`` seconds, keyed by request.
+
+    404, 410 and 451 responses are kept for ``negative_ttl`` seconds, so
+    known-missing pages aren't requested again; 0 (the default) skips them.
+    A response's Cache-Control ``max-age`` shortens its TTL, and
+    ``no-store`` or ``no-cache`` keeps it out of the cache.
+    At most ``max_entries`` responses are held; the oldest is dropped first.
+    """
+
+    def __init__(self, ttl: float, max_entries: int = 128, negative_ttl: float = 0) -> None:
+        self._ttl = ttl
+        self._negative_ttl = negative_ttl
+        self._max_entries = max_entries
+        self._entries: dict[Hashable, tuple[float, httpx.Response]] = {}
+
+    @staticmethod
+    def key(url: str, headers: Mapping[str, str], timeout: float) -> Hashable:
+        """Build the cache key for a GET request."""
+        return url, tuple(sorted(headers.items())), timeout
+
+    def get(self, key: Hashable) -> Optional[httpx.Response]:
+        """Return the cached response for ``key``, or None if absent or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, response = entry
+        if expires_at <= monotonic():
+            del self._entries[key]
+            return None
+        return response
+
+    def put(self, key: Hashable, response: httpx.Response) -> None:
+        """Store ``response`` if it was successful or a cacheable miss."""
+        if response.is_success:
+            ttl = self._ttl
+        elif response.status_code in _NEGATIVE_STATUSES:
+            ttl = self._negative_ttl
+        else:
+            return
+        max_age = _max_age(response)
+        if max_age is not None:
+            ttl = min(ttl, max_age)
+        if ttl <= 0:
+            return
+        self._entries.pop(key, None)
+        if len(self._entries) >= self._max_entries:
+            del self._entries[next(iter(self._entries))]
+        self._entries[key] = (monotonic() + ttl, response)
+
+    def clear(self) -> None:
+        """Drop every cached response."""
+        self._entries.clear()
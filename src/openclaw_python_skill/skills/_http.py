@@ -0,0 +1,58 @@
+"""Pooled httpx clients shared by the web skills."""
+
+import asyncio
+import contextlib
+from collections.abc import Mapping
+from importlib.util import find_spec
+from typing import Optional
+
+import httpx
+
+# HTTP/2 multiplexes requests to one host over a single connection. httpx
+# needs the optional h2 package for it, so it is only enabled when present.
+_HTTP2 = find_spec("h2") is not None
+
+# httpx's default pool sizes, but idle connections are kept for 30s instead
+# of 5s so skills called every few seconds still find a warm connection.
+_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=30.0)
+
+
+def new_client(headers: Mapping[str, str], timeout: float) -> httpx.Client:
+    """Create a pooled sync client with the shared connection settings."""
+    return httpx.Client(
+        headers=headers,
+        timeout=timeout,
+        follow_redirects=True,
+        limits=_LIMITS,
+        http2=_HTTP2,
+    )
+
+
+def new_async_client(headers: Mapping[str, str], timeout: float) -> httpx.AsyncClient:
+    """Create a pooled async client with the shared connection settings."""
+    return httpx.AsyncClient(
+        headers=headers,
+        timeout=timeout,
+        follow_redirects=True,
+        limits=_LIMITS,
+        http2=_HTTP2,
+    )
+
+
+async def close_async_client(
+    client: httpx.AsyncClient, loop: Optional[asyncio.AbstractEventLoop]
+) -> None:
+    """Close an async client whose connections were opened on ``loop``.
+
+    On the running loop this is a plain ``aclose()``. A loop still running in
+    another thread closes the client itself. Once that loop has stopped, its
+    connections can no longer be closed through it: the client is closed
+    here and the connections it drops are freed by the garbage collector.
+    """
+    running = asyncio.get_running_loop()
+    if loop is not None and loop is not running and loop.is_running():
+        asyncio.run_coroutine_threadsafe(client.aclose(), loop)
+        return
+    # Closing a connection tries to schedule on its (closed) loop.
+    with contextlib.suppress(RuntimeError):
+        await client.aclose()
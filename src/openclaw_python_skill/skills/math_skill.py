@@ -2,28 +2,20 @@
 
 import ast
 import math
-import operator
 import statistics as stats_mod
-from typing import Any
+from functools import lru_cache
+from types import CodeType
+from typing import Any, Callable, ClassVar
 
 from openclaw_python_skill.skill import Skill
 
 # Allowed binary operators for safe expression evaluation
-_BINARY_OPS: dict[type, Any] = {
-    ast.Add: operator.add,
-    ast.Sub: operator.sub,
-    ast.Mult: operator.mul,
-    ast.Div: operator.truediv,
-    ast.FloorDiv: operator.floordiv,
-    ast.Mod: operator.mod,
-    ast.Pow: operator.pow,
-}
+_BINARY_OPS: frozenset[type] = frozenset(
+    {ast.Add, ast.Sub, ast.Mult, ast.Div, ast.FloorDiv, ast.Mod, ast.Pow}
+)
 
 # Allowed unary operators
-_UNARY_OPS: dict[type, Any] = {
-    ast.UAdd: operator.pos,
-    ast.USub: operator.neg,
-}
+_UNARY_OPS: frozenset[type] = frozenset({ast.UAdd, ast.USub})
 
 # Allowed math functions and constants
 _MATH_NAMES: dict[str, Any] = {
@@ -66,75 +58,214 @@ _UNIT_TABLE: dict[str, tuple[str, float]] = {
     "d": ("time", 86400.0),
 }
 
-# Temperature units need special handling (non-linear)
-_TEMP_UNITS = {"C", "F", "K"}
+# Temperature units are affine, not a pure factor:
+# unit -> (scale, offset) such that celsius = scale * value + offset
+_TEMP_TO_CELSIUS: dict[str, tuple[float, float]] = {
+    "C": (1.0, 0.0),
+    "F": (5 / 9, -32 * 5 / 9),
+    "K": (1.0, -273.15),
+}
+
+# Every unit as (category, scale, offset) such that base = scale * value + offset
+_UNITS: dict[str, tuple[str, float, float]] = {
+    **{unit: (cat, factor, 0.0) for unit, (cat, factor) in _UNIT_TABLE.items()},
+    **{unit: ("temperature", *affine) for unit, affine in _TEMP_TO_CELSIUS.items()},
+}
+
+# Composed (scale, offset) for every pair of units in the same category:
+# result = scale * value + offset
+_FACTORS: dict[tuple[str, str], tuple[float, float]] = {
+    (from_unit, to_unit): (from_scale / to_scale, (from_offset - to_offset) / to_scale)
+    for from_unit, (from_cat, from_scale, from_offset) in _UNITS.items()
+    for to_unit, (to_cat, to_scale, to_offset) in _UNITS.items()
+    if from_cat == to_cat
+}
 
 
-def _safe_eval(expression: str) -> float:
-    """Safely evaluate a mathematical expression using AST parsing."""
+# Global the compiled code uses to coerce results back to float. It is not in
+# _MATH_NAMES, so expressions themselves cannot reference it.
+_FLOAT = "_float"
+
+# Globals for evaluating compiled expressions: no builtins, only the math
+# functions (numeric constants are inlined by _lower).
+_EVAL_GLOBALS: dict[str, Any] = {
+    "__builtins__": {},
+    _FLOAT: float,
+    **{name: value for name, value in _MATH_NAMES.items() if callable(value)},
+}
+
+
+def _as_float(node: ast.expr) -> ast.expr:
+    """Wrap a node in a call to float()."""
+    return ast.Call(func=ast.Name(id=_FLOAT, ctx=ast.Load()), args=[node], keywords=[])
+
+
+def _lower_constant(node: ast.Constant, variables: frozenset[str]) -> ast.expr:
+    if not isinstance(node.value, (int, float)):
+        raise ValueError("Unsupported expression element: Constant")
+    return ast.Constant(value=float(node.value))
+
+
+def _lower_name(node: ast.Name, variables: frozenset[str]) -> ast.expr:
+    if node.id in variables:
+        return ast.Name(id=node.id, ctx=ast.Load())
+    value = _MATH_NAMES.get(node.id)
+    if isinstance(value, float):
+        # Inline constants so compile() can fold them and no lookup is left.
+        return ast.Constant(value=value)
+    raise ValueError(f"Unknown name: {node.id}")
+
+
+def _lower_binop(node: ast.BinOp, variables: frozenset[str]) -> ast.expr:
+    if type(node.op) not in _BINARY_OPS:
+        raise ValueError(f"Unsupported operator: {type(node.op).__name__}")
+    binop = ast.BinOp(
+        left=_lower(node.left, variables), op=node.op, right=_lower(node.right, variables)
+    )
+    return _as_float(binop) if isinstance(node.op, ast.Pow) else binop
+
+
+def _lower_unaryop(node: ast.UnaryOp, variables: frozenset[str]) -> ast.expr:
+    if type(node.op) not in _UNARY_OPS:
+        raise ValueError(f"Unsupported operator: {type(node.op).__name__}")
+    return ast.UnaryOp(op=node.op, operand=_lower(node.operand, variables))
+
+
+def _lower_call(node: ast.Call, variables: frozenset[str]) -> ast.expr:
+    if not isinstance(node.func, ast.Name):
+        raise ValueError("Only simple function calls are allowed")
+    func_name = node.func.id
+    if func_name not in _MATH_NAMES:
+        raise ValueError(f"Unknown function: {func_name}")
+    if not callable(_MATH_NAMES[func_name]):
+        raise ValueError(f"{func_name} is not a function")
+    call = ast.Call(
+        func=ast.Name(id=func_name, ctx=ast.Load()),
+        args=[_lower(arg, variables) for arg in node.args],
+        keywords=[],
+    )
+    return _as_float(call)
+
+
+# AST node class -> lowering function; one dict lookup replaces the isinstance ladder.
+_LOWERERS: dict[type, Callable[[Any, frozenset[str]], ast.expr]] = {
+    ast.Constant: _lower_constant,
+    ast.Name: _lower_name,
+    ast.BinOp: _lower_binop,
+    ast.UnaryOp: _lower_unaryop,
+    ast.Call: _lower_call,
+}
+
+
+def _lower(node: ast.expr, variables: frozenset[str] = frozenset()) -> ast.expr:
+    """Validate an AST node and rebuild it as float-only arithmetic.
+
+    Integer literals become floats and calls and powers are wrapped in float(),
+    so the compiled code never produces ints, bools or complex numbers.
+    Names in ``variables`` are left as lookups; the caller binds them to floats.
+    """
+    lowerer = _LOWERERS.get(type(node))
+    if lowerer is None:
+        raise ValueError(f"Unsupported expression element: {type(node).__name__}")
+    return lowerer(node, variables)
+
+
+@lru_cache(maxsize=256)
+def _compile_cached(expression: str, variables: frozenset[str] = frozenset()) -> CodeType:
+    """Validate an expression once and compile it to a code object."""
+    tree = ast.Expression(body=_lower(ast.parse(expression, mode="eval").body, variables))
+    return compile(ast.fix_missing_locations(tree), "<expression>", "eval")
+
+
+def _compile(expression: str, variables: frozenset[str] = frozenset()) -> CodeType:
+    """Compile an expression, reporting syntax errors as ValueError."""
     try:
-        tree = ast.parse(expression, mode="eval")
+        return _compile_cached(expression, variables)
     except SyntaxError as err:
         raise ValueError(f"Invalid expression: {expression}") from err
-    return _eval_node(tree.body)
-
-
-def _eval_node(node: ast.expr) -> float:
-    """Recursively evaluate an AST node."""
-    if isinstance(node, ast.Constant) and isinstance(node.value, (int, float)):
-        return float(node.value)
-
-    if isinstance(node, ast.Name):
-        if node.id in _MATH_NAMES:
-            val = _MATH_NAMES[node.id]
-            if isinstance(val, float):
-                return val
-        raise ValueError(f"Unknown name: {node.id}")
-
-    if isinstance(node, ast.BinOp):
-        op_func = _BINARY_OPS.get(type(node.op))
-        if op_func is None:
-            raise ValueError(f"Unsupported operator: {type(node.op).__name__}")
-        return float(op_func(_eval_node(node.left), _eval_node(node.right)))
-
-    if isinstance(node, ast.UnaryOp):
-        op_func = _UNARY_OPS.get(type(node.op))
-        if op_func is None:
-            raise ValueError(f"Unsupported operator: {type(node.op).__name__}")
-        return float(op_func(_eval_node(node.operand)))
-
-    if isinstance(node, ast.Call):
-        if not isinstance(node.func, ast.Name):
-            raise ValueError("Only simple function calls are allowed")
-        func_name = node.func.id
-        if func_name not in _MATH_NAMES:
-            raise ValueError(f"Unknown function: {func_name}")
-        func = _MATH_NAMES[func_name]
-        if not callable(func):
-            raise ValueError(f"{func_name} is not a function")
-        args = [_eval_node(arg) for arg in node.args]
-        return float(func(*args))
-
-    raise ValueError(f"Unsupported expression element: {type(node).__name__}")
-
-
-def _convert_temperature(value: float, from_unit: str, to_unit: str) -> float:
-    """Convert between temperature units (C, F, K)."""
-    # Convert to Celsius first
-    if from_unit == "C":
-        celsius = value
-    elif from_unit == "F":
-        celsius = (value - 32) * 5 / 9
-    else:  # K
-        celsius = value - 273.15
-
-    # Convert from Celsius to target
-    if to_unit == "C":
-        return celsius
-    elif to_unit == "F":
-        return celsius * 9 / 5 + 32
-    else:  # K
-        return celsius + 273.15
+
+
+@lru_cache(maxsize=256)
+def _safe_eval(expression: str) -> float:
+    """Safely evaluate a mathematical expression.
+
+    Only whitelisted AST nodes reach compile(), and the code runs without
+    builtins, so evaluation is as restricted as walking the tree by hand.
+    Without variables the value depends only on the text, so it is cached
+    too; errors are raised again on each call, as lru_cache doesn't keep them.
+    """
+    return float(eval(_compile(expression), _EVAL_GLOBALS))
+
+
+def _eval_batch(expression: str, variables: dict[str, list[float]]) -> list[float]:
+    """Evaluate one expression for each row of equally long variable columns.
+
+    The expression is validated and compiled once; each row only rebinds the
+    variables in a single globals dict before running the code.
+    """
+    code = _compile(expression, frozenset(variables))
+    env = dict(_EVAL_GLOBALS)
+    names = list(variables)
+    results = []
+    for row in zip(*variables.values()):
+        env.update(zip(names, row))
+        results.append(float(eval(code, env)))
+    return results
+
+
+def _conversion(from_unit: str, to_unit: str) -> tuple[float, float]:
+    """Return (scale, offset) converting from_unit to to_unit."""
+    conversion = _FACTORS.get((from_unit, to_unit))
+    if conversion is None:
+        for unit in (from_unit, to_unit):
+            if unit not in _UNITS:
+                raise ValueError(f"Unknown unit: {unit}")
+        from_cat = _UNITS[from_unit][0]
+        to_cat = _UNITS[to_unit][0]
+        raise ValueError(f"Incompatible units: {from_unit} ({from_cat}) and {to_unit} ({to_cat})")
+    return conversion
+
+
+def _fsum(nums: list[float]) -> float:
+    """Correctly rounded sum, falling back to sum() where fsum() can't cope.
+
+    fsum raises on an intermediate overflow and on inf + -inf; sum() gives
+    inf or nan there, as the statistics action always has.
+    """
+    try:
+        return math.fsum(nums)
+    except (OverflowError, ValueError):
+        return sum(nums)
+
+
+def _mean(nums: list[float]) -> float:
+    """Float mean via fmean, or the exact statistics.mean where fmean fails.
+
+    fmean's fsum overflows on large values such as [1e308, 1e308], whose
+    mean statistics.mean still finds.
+    """
+    try:
+        return stats_mod.fmean(nums)
+    except (OverflowError, ValueError):
+        return stats_mod.mean(nums)
+
+
+def _spread(fn: Callable[[list[float]], float]) -> Callable[[list[float]], float]:
+    """Wrap a statistics spread function so a single value gives 0.0."""
+    return lambda nums: fn(nums) if len(nums) >= 2 else 0.0
+
+
+# Single statistics operations: name -> function of the list of floats.
+# Built once here instead of as fresh closures on every call.
+_STAT_OPS: dict[str, Callable[[list[float]], float]] = {
+    "mean": _mean,
+    "median": stats_mod.median,
+    "stdev": _spread(stats_mod.stdev),
+    "variance": _spread(stats_mod.variance),
+    "min": min,
+    "max": max,
+    "sum": _fsum,
+}
 
 
 class MathSkill(Skill):
@@ -142,22 +273,22 @@ class MathSkill(Skill):
 
     Provides actions for:
     - evaluate: Safely evaluate mathematical expressions
+    - evaluate_batch: Evaluate one expression over lists of variable values
     - convert_units: Convert between units (length, weight, temperature, time)
+    - convert_units_batch: Convert a list of values between two units
     - statistics: Compute statistical measures on a list of numbers
     """
 
+    __slots__ = ()
+
     def __init__(self) -> None:
         super().__init__(name="math", version="1.0.0")
 
     def process(self, action: str, parameters: dict[str, Any]) -> dict[str, Any]:
-        if action == "evaluate":
-            return self._evaluate(parameters)
-        elif action == "convert_units":
-            return self._convert_units(parameters)
-        elif action == "statistics":
-            return self._statistics(parameters)
-        else:
+        handler = self._ACTIONS.get(action)
+        if handler is None:
             raise ValueError(f"Unknown action: {action}")
+        return handler(self, parameters)
 
     def _evaluate(self, parameters: dict[str, Any]) -> dict[str, Any]:
         """Safely evaluate a mathematical expression."""
@@ -181,32 +312,8 @@ class MathSkill(Skill):
             raise ValueError("Missing required parameter: to_unit")
 
         value = float(value)
-
-        # Temperature special case
-        if from_unit in _TEMP_UNITS and to_unit in _TEMP_UNITS:
-            result = _convert_temperature(value, from_unit, to_unit)
-            return {
-                "value": value,
-                "from_unit": from_unit,
-                "to_unit": to_unit,
-                "result": round(result, 6),
-            }
-
-        # Standard unit conversion via base unit
-        if from_unit not in _UNIT_TABLE:
-            raise ValueError(f"Unknown unit: {from_unit}")
-        if to_unit not in _UNIT_TABLE:
-            raise ValueError(f"Unknown unit: {to_unit}")
-
-        from_cat, from_factor = _UNIT_TABLE[from_unit]
-        to_cat, to_factor = _UNIT_TABLE[to_unit]
-
-        if from_cat != to_cat:
-            raise ValueError(
-                f"Incompatible units: {from_unit} ({from_cat}) and {to_unit} ({to_cat})"
-            )
-
-        result = value * from_factor / to_factor
+        scale, offset = _conversion(from_unit, to_unit)
+        result = scale * value + offset
         return {
             "value": value,
             "from_unit": from_unit,
@@ -214,50 +321,99 @@ class MathSkill(Skill):
             "result": round(result, 6),
         }
 
+    def _evaluate_batch(self, parameters: dict[str, Any]) -> dict[str, Any]:
+        """Evaluate one expression over columns of variable values."""
+        expression = parameters.get("expression")
+        if not expression:
+            raise ValueError("Missing required parameter: expression")
+        variables = parameters.get("variables")
+        if not isinstance(variables, dict) or not variables:
+            raise ValueError("Parameter 'variables' must be a non-empty dict of lists")
+
+        columns: dict[str, list[float]] = {}
+        for name, values in variables.items():
+            if not (isinstance(name, str) and name.isidentifier()) or name.startswith("_"):
+                raise ValueError(f"Invalid variable name: {name}")
+            if name in _MATH_NAMES:
+                raise ValueError(f"Variable name shadows a math name: {name}")
+            if not isinstance(values, list):
+                raise ValueError(f"Variable '{name}' must be a list of numbers")
+            columns[name] = list(map(float, values))
+        if len({len(values) for values in columns.values()}) > 1:
+            raise ValueError("All variable lists must have the same length")
+
+        results = _eval_batch(str(expression), columns)
+        return {"expression": str(expression), "results": results, "count": len(results)}
+
+    def _convert_units_batch(self, parameters: dict[str, Any]) -> dict[str, Any]:
+        """Convert a list of values between the same pair of units."""
+        values = parameters.get("values")
+        if not isinstance(values, list):
+            raise ValueError("Missing required parameter: values (a list of numbers)")
+        from_unit = parameters.get("from_unit")
+        if not from_unit:
+            raise ValueError("Missing required parameter: from_unit")
+        to_unit = parameters.get("to_unit")
+        if not to_unit:
+            raise ValueError("Missing required parameter: to_unit")
+
+        nums = list(map(float, values))
+        # Resolve the conversion once for the whole batch.
+        scale, offset = _conversion(from_unit, to_unit)
+        results = [round(scale * v + offset, 6) for v in nums]
+        return {
+            "values": nums,
+            "from_unit": from_unit,
+            "to_unit": to_unit,
+            "results": results,
+        }
+
     def _statistics(self, parameters: dict[str, Any]) -> dict[str, Any]:
         """Compute statistics on a list of numbers."""
         numbers = parameters.get("numbers")
         if numbers is None:
             raise ValueError("Missing required parameter: numbers")
-        if not isinstance(numbers, list) or len(numbers) == 0:
+        if hasattr(numbers, "tolist"):
+            # array.array, memoryview and NumPy arrays unpack to Python
+            # numbers in one C-level call instead of item by item.
+            numbers = numbers.tolist()
+        if not isinstance(numbers, (list, tuple)) or len(numbers) == 0:
             raise ValueError("Parameter 'numbers' must be a non-empty list")
 
-        nums = [float(n) for n in numbers]
+        nums = list(map(float, numbers))
         operation = parameters.get("operation", "summary")
 
         if operation == "summary":
-            stdev = stats_mod.stdev(nums) if len(nums) >= 2 else 0.0
-            variance = stats_mod.variance(nums) if len(nums) >= 2 else 0.0
             return {
                 "numbers": nums,
                 "count": len(nums),
-                "mean": stats_mod.mean(nums),
+                "mean": _mean(nums),
                 "median": stats_mod.median(nums),
-                "stdev": round(stdev, 6),
-                "variance": round(variance, 6),
+                # Same functions as the single operations, so both agree.
+                "stdev": round(_STAT_OPS["stdev"](nums), 6),
+                "variance": round(_STAT_OPS["variance"](nums), 6),
                 "min": min(nums),
                 "max": max(nums),
-                "sum": sum(nums),
+                "sum": _fsum(nums),
             }
 
-        ops: dict[str, Any] = {
-            "mean": lambda: stats_mod.mean(nums),
-            "median": lambda: stats_mod.median(nums),
-            "stdev": lambda: stats_mod.stdev(nums) if len(nums) >= 2 else 0.0,
-            "variance": lambda: stats_mod.variance(nums) if len(nums) >= 2 else 0.0,
-            "min": lambda: min(nums),
-            "max": lambda: max(nums),
-            "sum": lambda: sum(nums),
-        }
-
-        if operation not in ops:
-            raise ValueError(
-                f"Unknown operation: {operation}. Supported: summary, {', '.join(sorted(ops))}"
-            )
+        op = _STAT_OPS.get(operation)
+        if op is None:
+            supported = ", ".join(sorted(_STAT_OPS))
+            raise ValueError(f"Unknown operation: {operation}. Supported: summary, {supported}")
 
         return {
             "numbers": nums,
             "count": len(nums),
             "operation": operation,
-            "result": ops[operation](),
+            "result": op(nums),
         }
+
+    # Action name -> handler, built once with the class.
+    _ACTIONS: ClassVar[dict[str, Callable[..., dict[str, Any]]]] = {
+        "evaluate": _evaluate,
+        "evaluate_batch": _evaluate_batch,
+        "convert_units": _convert_units,
+        "convert_units_batch": _convert_units_batch,
+        "statistics": _statistics,
+    }
@@ -1,10 +1,20 @@
 """Text Analysis Skill - Example skill for OpenClaw."""
 
 import re
-from typing import Any
+from collections import Counter
+from typing import Any, Callable, ClassVar
 
 from openclaw_python_skill.skill import Skill
 
+_SENTENCE_SPLIT_RE = re.compile(r"[.!?]+")
+_URL_RE = re.compile(r"https?://[^\s]+")
+_EMAIL_RE = re.compile(r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}")
+_PHONE_RE = re.compile(r"\b\d{3}[-.\s]?\d{3}[-.\s]?\d{4}\b")
+
+# Sentiment keywords, already lower-case to match the lowered tokens.
+_POSITIVE_WORDS = frozenset({"good", "great", "excellent", "nice", "love", "happy", "awesome"})
+_NEGATIVE_WORDS = frozenset({"bad", "terrible", "awful", "hate", "sad", "angry", "poor"})
+
 
 class TextAnalyzerSkill(Skill):
     """Analyze text for statistics, sentiment, and patterns.
@@ -15,6 +25,8 @@ class TextAnalyzerSkill(Skill):
     - text_patterns: Find URLs, emails, phone numbers
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(name="text-analyzer", version="1.0.0")
 
@@ -36,38 +48,33 @@ class TextAnalyzerSkill(Skill):
 
         text = parameters["text"]
 
-        if action == "text_stats":
-            return self._analyze_stats(text)
-        elif action == "text_sentiment":
-            return self._analyze_sentiment(text)
-        elif action == "text_patterns":
-            return self._find_patterns(text)
-        else:
+        handler = self._ACTIONS.get(action)
+        if handler is None:
             raise ValueError(f"Unknown action: {action}")
+        return handler(self, text)
 
     def _analyze_stats(self, text: str) -> dict[str, Any]:
         """Analyze text statistics."""
         words = text.split()
-        sentences = re.split(r"[.!?]+", text)
+        word_count = len(words)
+        sentence_count = sum(1 for s in _SENTENCE_SPLIT_RE.split(text) if s.strip())
 
         return {
-            "word_count": len(words),
+            "word_count": word_count,
             "char_count": len(text),
-            "char_count_no_spaces": len(text.replace(" ", "")),
-            "sentence_count": len([s for s in sentences if s.strip()]),
-            "avg_word_length": sum(len(w) for w in words) / len(words) if words else 0,
-            "avg_words_per_sentence": len(words) / max(len([s for s in sentences if s.strip()]), 1),
+            "char_count_no_spaces": len(text) - text.count(" "),
+            "sentence_count": sentence_count,
+            "avg_word_length": sum(map(len, words)) / word_count if words else 0,
+            "avg_words_per_sentence": word_count / max(sentence_count, 1),
         }
 
     def _analyze_sentiment(self, text: str) -> dict[str, Any]:
         """Simple sentiment analysis."""
-        positive_words = {"good", "great", "excellent", "nice", "love", "happy", "awesome"}
-        negative_words = {"bad", "terrible", "awful", "hate", "sad", "angry", "poor"}
+        # One counting pass over the tokens, then a lookup per keyword.
+        counts = Counter(text.lower().split())
 
-        words_lower = text.lower().split()
-
-        pos_count = sum(1 for w in words_lower if w in positive_words)
-        neg_count = sum(1 for w in words_lower if w in negative_words)
+        pos_count = sum(counts[w] for w in _POSITIVE_WORDS)
+        neg_count = sum(counts[w] for w in _NEGATIVE_WORDS)
 
         if pos_count > neg_count:
             sentiment = "positive"
@@ -85,13 +92,12 @@ class TextAnalyzerSkill(Skill):
 
     def _find_patterns(self, text: str) -> dict[str, Any]:
         """Find patterns in text (URLs, emails, phone numbers)."""
-        url_pattern = r"https?://[^\s]+"
-        email_pattern = r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}"
-        phone_pattern = r"\b\d{3}[-.\s]?\d{3}[-.\s]?\d{4}\b"
-
-        urls = re.findall(url_pattern, text)
-        emails = re.findall(email_pattern, text)
-        phones = re.findall(phone_pattern, text)
+        # Every URL contains "://" and every email an "@"; checking for the
+        # literal first skips the regex scan entirely for most texts, and the
+        # email scan is quadratic on long runs of word characters.
+        urls = _URL_RE.findall(text) if "://" in text else []
+        emails = _EMAIL_RE.findall(text) if "@" in text else []
+        phones = _PHONE_RE.findall(text)
 
         return {
             "urls": urls,
@@ -99,3 +105,10 @@ class TextAnalyzerSkill(Skill):
             "phone_numbers": phones,
             "patterns_found": len(urls) + len(emails) + len(phones),
         }
+
+    # Action name -> handler, built once with the class.
+    _ACTIONS: ClassVar[dict[str, Callable[..., dict[str, Any]]]] = {
+        "text_stats": _analyze_stats,
+        "text_sentiment": _analyze_sentiment,
+        "text_patterns": _find_patterns,
+    }
@@ -1,14 +1,59 @@
 """Web Fetch Skill - Basic web fetching for OpenClaw."""
 
+import asyncio
+import codecs
 import re
-from typing import Any
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Any, Callable, ClassVar, Optional
 
 import httpx
 
 from openclaw_python_skill.skill import Skill
+from openclaw_python_skill.skills._cache import ResponseCache
+from openclaw_python_skill.skills._http import close_async_client, new_async_client, new_client
 
-_DEFAULT_HEADERS = {"User-Agent": "OpenClaw/1.0"}
+# Read-only so the shared default can be handed to httpx without copying.
+_DEFAULT_HEADERS: Mapping[str, str] = MappingProxyType({"User-Agent": "OpenClaw/1.0"})
 _DEFAULT_TIMEOUT = 10
+# Requests fetch_many keeps in flight at once under aprocess, unless overridden.
+_DEFAULT_CONCURRENCY = 20
+# Failures fetch_many reports per URL. InvalidURL is not an HTTPError.
+_URL_ERRORS = (httpx.HTTPError, httpx.InvalidURL)
+
+# Pages longer than this (in characters) are stripped to text in a worker
+# thread by aprocess, so large documents don't stall the event loop.
+_OFFLOAD_TEXT_CHARS = 256 * 1024
+_TEXT_ACTIONS = frozenset({"extract_text", "extract_all"})
+
+_LINK_RE = re.compile(r'<a\s+[^>]*href=["\']([^"\']+)["\']', re.IGNORECASE)
+# Same pattern over raw bytes, so link extraction needn't decode the whole page.
+_LINK_BYTES_RE = re.compile(_LINK_RE.pattern.encode(), re.IGNORECASE)
+# Codecs (by codecs.lookup name) that encode ASCII as itself and never use
+# ASCII bytes inside a multi-byte character, so the bytes pattern is safe.
+_ASCII_COMPATIBLE = frozenset(
+    {"ascii", "utf-8", "utf-8-sig", "mac-roman", "koi8-r", "koi8-u"}
+    | {f"cp{n}" for n in range(1250, 1259)}
+    | {f"iso8859-{n}" for n in range(1, 17)}
+)
+_SCRIPT_STYLE_RE = re.compile(r"<(script|style)[^>]*>.*?</\1>", re.DOTALL | re.IGNORECASE)
+_TAG_RE = re.compile(r"<[^>]+>")
+
+
+def _ascii_compatible(encoding: str) -> bool:
+    """Whether markup in ``encoding`` can be matched as ASCII bytes."""
+    try:
+        return codecs.lookup(encoding).name in _ASCII_COMPATIBLE
+    except LookupError:
+        return False
+
+
+def _strip_html(html: str) -> str:
+    """Drop script/style blocks and tags, collapsing whitespace to single spaces."""
+    text = _SCRIPT_STYLE_RE.sub("", html)
+    text = _TAG_RE.sub(" ", text)
+    # split()/join() collapses whitespace without a third regex pass.
+    return " ".join(text.split())
 
 
 class WebFetchSkill(Skill):
@@ -18,36 +63,189 @@ class WebFetchSkill(Skill):
     - fetch: Retrieve a URL and return status, headers, and content
     - extract_links: Extract all hyperlinks from a page
     - extract_text: Strip HTML tags and return plain text
+    - extract_all: Links and plain text from a single fetch
+    - fetch_many: Fetch several URLs (concurrently under ``aprocess``)
+
+    Pass ``cache_ttl`` (seconds) to reuse successful responses for repeated
+    requests to the same URL, and ``negative_cache_ttl`` to remember 404, 410
+    and 451 responses; caching is off by default.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, cache_ttl: float = 0, negative_cache_ttl: float = 0) -> None:
         super().__init__(name="web-fetch", version="1.0.0")
+        caching = cache_ttl > 0 or negative_cache_ttl > 0
+        self._cache = ResponseCache(cache_ttl, negative_ttl=negative_cache_ttl) if caching else None
+        self._http: Optional[httpx.Client] = None
+        self._ahttp: Optional[httpx.AsyncClient] = None
+        # Event loop the async client was created on; its pool is bound to it.
+        self._aloop: Optional[asyncio.AbstractEventLoop] = None
 
     def process(self, action: str, parameters: dict[str, Any]) -> dict[str, Any]:
+        if action == "fetch_many":
+            return self._fetch_many(parameters)
+        url, headers, timeout = self._request_args(action, parameters)
+        return self._build_result(action, self._cached_get(url, headers, timeout))
+
+    async def aprocess(self, action: str, parameters: dict[str, Any]) -> dict[str, Any]:
+        """Like `process`, but fetches without blocking the event loop."""
+        if action == "fetch_many":
+            return await self._afetch_many(parameters)
+        url, headers, timeout = self._request_args(action, parameters)
+        response = await self._acached_get(url, headers, timeout)
+        if action in _TEXT_ACTIONS and len(response.text) > _OFFLOAD_TEXT_CHARS:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(None, self._build_result, action, response)
+        return self._build_result(action, response)
+
+    def _request_args(
+        self, action: str, parameters: dict[str, Any]
+    ) -> tuple[str, Mapping[str, str], int]:
+        """Validate parameters and return (url, headers, timeout)."""
         url = parameters.get("url")
         if not url:
             raise ValueError("Missing required parameter: url")
+        if action not in self._ACTIONS:
+            raise ValueError(f"Unknown action: {action}")
+        return (url, *self._request_options(parameters))
 
+    def _request_options(self, parameters: dict[str, Any]) -> tuple[Mapping[str, str], int]:
+        """Return the (headers, timeout) a request should use."""
         timeout = parameters.get("timeout", _DEFAULT_TIMEOUT)
-        headers = {**_DEFAULT_HEADERS, **parameters.get("headers", {})}
-
-        if action == "fetch":
-            return self._fetch(url, headers, timeout)
-        elif action == "extract_links":
-            return self._extract_links(url, headers, timeout)
-        elif action == "extract_text":
-            return self._extract_text(url, headers, timeout)
-        else:
-            raise ValueError(f"Unknown action: {action}")
+        user_headers = parameters.get("headers")
+        headers = {**_DEFAULT_HEADERS, **user_headers} if user_headers else _DEFAULT_HEADERS
+        return headers, timeout
+
+    def _fetch_many(self, parameters: dict[str, Any]) -> dict[str, Any]:
+        """Fetch each URL in turn; a failed URL is reported, not raised."""
+        urls, _ = self._many_args(parameters)
+        headers, timeout = self._request_options(parameters)
+        results = []
+        for url in urls:
+            try:
+                response = self._cached_get(url, headers, timeout)
+            except _URL_ERRORS as e:
+                results.append({"url": url, "error": str(e)})
+            else:
+                results.append(self._fetch_result(response))
+        return self._many_result(results)
 
-    def _get(self, url: str, headers: dict[str, str], timeout: int) -> httpx.Response:
-        """Perform a GET request."""
-        with httpx.Client(headers=headers, timeout=timeout, follow_redirects=True) as client:
-            return client.get(url)
+    async def _afetch_many(self, parameters: dict[str, Any]) -> dict[str, Any]:
+        """Fetch all URLs concurrently, at most ``concurrency`` at a time."""
+        urls, concurrency = self._many_args(parameters)
+        headers, timeout = self._request_options(parameters)
+        semaphore = asyncio.Semaphore(concurrency)
 
-    def _fetch(self, url: str, headers: dict[str, str], timeout: int) -> dict[str, Any]:
-        """Fetch a URL and return response details."""
-        response = self._get(url, headers, timeout)
+        async def fetch_one(url: str) -> dict[str, Any]:
+            async with semaphore:
+                try:
+                    response = await self._acached_get(url, headers, timeout)
+                except _URL_ERRORS as e:
+                    return {"url": url, "error": str(e)}
+            return self._fetch_result(response)
+
+        return self._many_result(list(await asyncio.gather(*map(fetch_one, urls))))
+
+    def _many_args(self, parameters: dict[str, Any]) -> tuple[list[str], int]:
+        """Validate and return the (urls, concurrency) of fetch_many."""
+        urls = parameters.get("urls")
+        if not isinstance(urls, list) or not urls:
+            raise ValueError("Missing required parameter: urls (a non-empty list)")
+        if not all(isinstance(url, str) for url in urls):
+            raise ValueError("Parameter 'urls' must contain only strings")
+        concurrency = parameters.get("concurrency", _DEFAULT_CONCURRENCY)
+        # bool is an int subclass, but True is not a request count.
+        if not isinstance(concurrency, int) or isinstance(concurrency, bool) or concurrency < 1:
+            raise ValueError("Parameter 'concurrency' must be a positive integer")
+        return urls, concurrency
+
+    def _many_result(self, results: list[dict[str, Any]]) -> dict[str, Any]:
+        """Wrap per-URL results, in request order."""
+        return {
+            "results": results,
+            "count": len(results),
+            "failed": sum("error" in result for result in results),
+        }
+
+    def _build_result(self, action: str, response: httpx.Response) -> dict[str, Any]:
+        """Turn a response into the result dict for an action."""
+        return self._ACTIONS[action](self, response)
+
+    def _client(self) -> httpx.Client:
+        """Return the pooled HTTP client, creating it on first use."""
+        if self._http is None:
+            self._http = new_client(_DEFAULT_HEADERS, _DEFAULT_TIMEOUT)
+        return self._http
+
+    async def _aclient(self) -> httpx.AsyncClient:
+        """Return the pooled async client for the running event loop.
+
+        A client left over from another loop (e.g. an earlier asyncio.run)
+        is closed before a new one replaces it.
+        """
+        loop = asyncio.get_running_loop()
+        if self._ahttp is not None and self._aloop is not loop:
+            stale, stale_loop = self._ahttp, self._aloop
+            self._ahttp = self._aloop = None
+            await close_async_client(stale, stale_loop)
+        if self._ahttp is None:
+            self._ahttp = new_async_client(_DEFAULT_HEADERS, _DEFAULT_TIMEOUT)
+            self._aloop = loop
+        return self._ahttp
+
+    def close(self) -> None:
+        """Close pooled connections. A later request opens a new client."""
+        if self._http is not None:
+            self._http.close()
+            self._http = None
+
+    async def aclose(self) -> None:
+        """Close the pooled sync and async clients."""
+        self.close()
+        if self._ahttp is not None:
+            client, loop = self._ahttp, self._aloop
+            self._ahttp = self._aloop = None
+            await close_async_client(client, loop)
+
+    def invalidate_cache(self) -> None:
+        """Forget cached responses so the next request goes to the network."""
+        if self._cache is not None:
+            self._cache.clear()
+
+    def _cached_get(self, url: str, headers: Mapping[str, str], timeout: int) -> httpx.Response:
+        """GET through the response cache, if one is enabled."""
+        if self._cache is None:
+            return self._get(url, headers, timeout)
+        key = ResponseCache.key(url, headers, timeout)
+        response = self._cache.get(key)
+        if response is None:
+            response = self._get(url, headers, timeout)
+            self._cache.put(key, response)
+        return response
+
+    async def _acached_get(
+        self, url: str, headers: Mapping[str, str], timeout: int
+    ) -> httpx.Response:
+        """Async GET through the response cache, if one is enabled."""
+        if self._cache is None:
+            return await self._aget(url, headers, timeout)
+        key = ResponseCache.key(url, headers, timeout)
+        response = self._cache.get(key)
+        if response is None:
+            response = await self._aget(url, headers, timeout)
+            self._cache.put(key, response)
+        return response
+
+    def _get(self, url: str, headers: Mapping[str, str], timeout: int) -> httpx.Response:
+        """Perform a GET request over the pooled client."""
+        return self._client().get(url, headers=headers, timeout=timeout)
+
+    async def _aget(self, url: str, headers: Mapping[str, str], timeout: int) -> httpx.Response:
+        """Perform a GET request over the pooled async client."""
+        client = await self._aclient()
+        return await client.get(url, headers=headers, timeout=timeout)
+
+    def _fetch_result(self, response: httpx.Response) -> dict[str, Any]:
+        """Return response details."""
         return {
             "url": str(response.url),
             "status_code": response.status_code,
@@ -56,30 +254,40 @@ class WebFetchSkill(Skill):
             "content_length": len(response.text),
         }
 
-    def _extract_links(self, url: str, headers: dict[str, str], timeout: int) -> dict[str, Any]:
+    def _links_result(self, response: httpx.Response) -> dict[str, Any]:
         """Extract all <a href="..."> links from a page."""
-        response = self._get(url, headers, timeout)
-        pattern = r'<a\s+[^>]*href=["\']([^"\']+)["\']'
-        links = re.findall(pattern, response.text, re.IGNORECASE)
+        encoding = response.encoding or "utf-8"
+        if _ascii_compatible(encoding):
+            links = [
+                href.decode(encoding, "replace")
+                for href in _LINK_BYTES_RE.findall(response.content)
+            ]
+        else:
+            # Any other codec (UTF-16, ISO-2022-JP, EBCDIC...) is matched as text.
+            links = _LINK_RE.findall(response.text)
         return {
             "url": str(response.url),
             "links": links,
             "link_count": len(links),
         }
 
-    def _extract_text(self, url: str, headers: dict[str, str], timeout: int) -> dict[str, Any]:
+    def _text_result(self, response: httpx.Response) -> dict[str, Any]:
         """Strip HTML tags and return plain text."""
-        response = self._get(url, headers, timeout)
-        # Remove script and style blocks
-        text = re.sub(
-            r"<(script|style)[^>]*>.*?</\1>", "", response.text, flags=re.DOTALL | re.IGNORECASE
-        )
-        # Remove HTML tags
-        text = re.sub(r"<[^>]+>", " ", text)
-        # Normalize whitespace
-        text = re.sub(r"\s+", " ", text).strip()
+        text = _strip_html(response.text)
         return {
             "url": str(response.url),
             "text": text,
             "text_length": len(text),
         }
+
+    def _all_result(self, response: httpx.Response) -> dict[str, Any]:
+        """Return both the links and the plain text of one response."""
+        return {**self._links_result(response), **self._text_result(response)}
+
+    # Action name -> builder of its result from the response.
+    _ACTIONS: ClassVar[dict[str, Callable[..., dict[str, Any]]]] = {
+        "fetch": _fetch_result,
+        "extract_links": _links_result,
+        "extract_text": _text_result,
+        "extract_all": _all_result,
+    }
@@ -2,21 +2,58 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any
+import asyncio
+import re
+from collections.abc import Mapping
+from functools import cache, lru_cache
+from importlib.util import find_spec
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Callable, ClassVar
 
 import httpx
 
 from openclaw_python_skill.skill import Skill
+from openclaw_python_skill.skills._cache import ResponseCache
+from openclaw_python_skill.skills._http import close_async_client, new_async_client, new_client
 
 if TYPE_CHECKING:
     from bs4 import BeautifulSoup
+    from soupsieve import SoupSieve
 
-_DEFAULT_HEADERS = {"User-Agent": "OpenClaw/1.0"}
+# Read-only so the shared default can be handed to httpx without copying.
+_DEFAULT_HEADERS: Mapping[str, str] = MappingProxyType({"User-Agent": "OpenClaw/1.0"})
 _DEFAULT_TIMEOUT = 10
 
+# Pages longer than this (in characters) are parsed in a worker thread by
+# aprocess, so large documents don't stall the event loop.
+_OFFLOAD_PARSE_CHARS = 256 * 1024
 
+# Bodies are read up to this many bytes; the rest of a larger page is dropped.
+_DEFAULT_MAX_BYTES = 5 * 1024 * 1024
+_HTML_TYPES = frozenset({"text/html", "application/xhtml+xml"})
+# Describe the encoded body, so they don't carry over to a re-built response.
+_BODY_HEADERS = frozenset({"content-encoding", "content-length", "transfer-encoding"})
+
+# The only tags extract_meta reads; the rest of the page is not built into the tree.
+_META_TAGS = ("title", "meta")
+# extract_meta parses only up to the closing head tag, when there is one.
+# Comments and script/style/title contents are skipped to their closer, so
+# a "</head>" inside them doesn't end the head early.
+_HEAD_SCAN_RE = re.compile(r"<!--|<(script|style|title)\b|(</head\s*>)", re.IGNORECASE)
+_RAW_TEXT_END_RE = {
+    tag: re.compile(rf"</{tag}\s*>", re.IGNORECASE) for tag in ("script", "style", "title")
+}
+
+# Parsed pages each instance keeps, so actions on the same HTML share a tree.
+_PARSE_CACHE_SIZE = 4
+
+# lxml's C parser is several times faster than the stdlib one; use it if present.
+_PARSER = "lxml" if find_spec("lxml") is not None else "html.parser"
+
+
+@cache
 def _import_bs4() -> type:
-    """Lazy-import BeautifulSoup, raising a clear error if not installed."""
+    """Lazy-import BeautifulSoup once, raising a clear error if not installed."""
     try:
         from bs4 import BeautifulSoup  # noqa: N812
 
@@ -28,78 +65,284 @@ def _import_bs4() -> type:
         ) from err
 
 
+def _check_html(response: httpx.Response) -> None:
+    """Reject a successful response that isn't HTML, before its body is read.
+
+    Error responses pass whatever their type, so they reach the cache (and
+    its negative entries) like any other.
+    """
+    if not response.is_success:
+        return
+    content_type = response.headers.get("content-type", "")
+    media_type = content_type.split(";", 1)[0].strip().lower()
+    if media_type and media_type not in _HTML_TYPES:
+        raise ValueError(f"Unsupported content type: {content_type}")
+
+
+def _with_body(response: httpx.Response, body: bytes, max_bytes: int) -> httpx.Response:
+    """Return a read copy of a streamed response, holding ``body``.
+
+    A body longer than ``max_bytes`` is cut there, and the copy's
+    ``truncated`` extension is set.
+    """
+    headers = [
+        (name, value)
+        for name, value in response.headers.multi_items()
+        if name.lower() not in _BODY_HEADERS
+    ]
+    return httpx.Response(
+        response.status_code,
+        headers=headers,
+        content=body[:max_bytes],
+        request=response.request,
+        extensions={"truncated": len(body) > max_bytes},
+    )
+
+
+def _head_end(html: str) -> int | None:
+    """Return the offset of the page's closing head tag, or None.
+
+    An unterminated comment or script/style/title also gives None (the page
+    is parsed whole), so each part of the text is scanned at most once.
+    """
+    match = _HEAD_SCAN_RE.search(html)
+    while match is not None:
+        if match.group(2):
+            return match.start()
+        if match.group(1):
+            closer = _RAW_TEXT_END_RE[match.group(1).lower()].search(html, match.end())
+            if closer is None:
+                return None
+            pos = closer.end()
+        else:
+            end = html.find("-->", match.end())
+            if end < 0:
+                return None
+            pos = end + len("-->")
+        match = _HEAD_SCAN_RE.search(html, pos)
+    return None
+
+
+def _parse(html: str, only: tuple[str, ...] | None = None) -> BeautifulSoup:
+    """Parse a page into a BeautifulSoup tree.
+
+    With ``only``, the tree holds just those tags (and their contents).
+    Each skill caches the trees it builds (see ``WebScraperSkill._parse``),
+    so handlers must only read from them.
+    """
+    soup_cls = _import_bs4()
+    if only is None:
+        soup: BeautifulSoup = soup_cls(html, _PARSER)
+    else:
+        from bs4 import SoupStrainer
+
+        soup = soup_cls(html, _PARSER, parse_only=SoupStrainer(list(only)))
+    return soup
+
+
+@lru_cache(maxsize=64)
+def _compile_selector(selector: str) -> SoupSieve:
+    """Compile a CSS selector once; an invalid one raises ValueError."""
+    import soupsieve  # installed with beautifulsoup4
+
+    try:
+        return soupsieve.compile(selector)
+    except soupsieve.SelectorSyntaxError as err:
+        raise ValueError(f"Invalid CSS selector: {selector}") from err
+
+
 class WebScraperSkill(Skill):
     """Scrape web pages using BeautifulSoup for structured extraction.
 
     Provides actions for:
     - extract_meta: Extract title, meta description, and Open Graph tags
     - extract_elements: Extract elements matching a CSS selector
+
+    Pass ``cache_ttl`` (seconds) to reuse successful responses for repeated
+    requests to the same URL, and ``negative_cache_ttl`` to remember 404, 410
+    and 451 responses; caching is off by default. Bodies are streamed
+    and cut off after ``max_bytes``, which sets ``truncated`` in the result;
+    successful non-HTML responses are rejected from their headers, without
+    reading the body.
     """
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        cache_ttl: float = 0,
+        max_bytes: int = _DEFAULT_MAX_BYTES,
+        negative_cache_ttl: float = 0,
+    ) -> None:
         _import_bs4()  # fail fast if bs4 is not installed
         super().__init__(name="web-scraper", version="1.0.0")
+        caching = cache_ttl > 0 or negative_cache_ttl > 0
+        self._cache = ResponseCache(cache_ttl, negative_ttl=negative_cache_ttl) if caching else None
+        self._max_bytes = max_bytes
+        # A few recent pages per instance, so their trees are freed with it.
+        self._parse = lru_cache(maxsize=_PARSE_CACHE_SIZE)(_parse)
+        self._http: httpx.Client | None = None
+        self._ahttp: httpx.AsyncClient | None = None
+        # Event loop the async client was created on; its pool is bound to it.
+        self._aloop: asyncio.AbstractEventLoop | None = None
 
     def process(self, action: str, parameters: dict[str, Any]) -> dict[str, Any]:
+        url, headers, timeout = self._request_args(action, parameters)
+        response = self._cached_get(url, headers, timeout)
+        return self._ACTIONS[action](self, response, parameters)
+
+    async def aprocess(self, action: str, parameters: dict[str, Any]) -> dict[str, Any]:
+        """Like `process`, but fetches without blocking the event loop."""
+        url, headers, timeout = self._request_args(action, parameters)
+        response = await self._acached_get(url, headers, timeout)
+        handler = self._ACTIONS[action]
+        if len(response.text) > _OFFLOAD_PARSE_CHARS:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(None, handler, self, response, parameters)
+        return handler(self, response, parameters)
+
+    def _request_args(
+        self, action: str, parameters: dict[str, Any]
+    ) -> tuple[str, Mapping[str, str], int]:
+        """Validate parameters and return (url, headers, timeout)."""
         url = parameters.get("url")
         if not url:
             raise ValueError("Missing required parameter: url")
-
-        timeout = parameters.get("timeout", _DEFAULT_TIMEOUT)
-        headers = {**_DEFAULT_HEADERS, **parameters.get("headers", {})}
-
-        if action == "extract_meta":
-            return self._extract_meta(url, headers, timeout)
-        elif action == "extract_elements":
+        if action not in self._ACTIONS:
+            raise ValueError(f"Unknown action: {action}")
+        # Checked before fetching, so a bad call costs no request.
+        if action == "extract_elements":
             selector = parameters.get("selector")
             if not selector:
                 raise ValueError("Missing required parameter: selector")
-            return self._extract_elements(url, headers, timeout, selector)
-        else:
-            raise ValueError(f"Unknown action: {action}")
+            _compile_selector(selector)
 
-    def _get_soup(
-        self, url: str, headers: dict[str, str], timeout: int
-    ) -> tuple[BeautifulSoup, str]:
-        """Fetch a URL and return a BeautifulSoup object and final URL."""
-        soup_cls = _import_bs4()
-        with httpx.Client(headers=headers, timeout=timeout, follow_redirects=True) as client:
-            response = client.get(url)
-        return soup_cls(response.text, "html.parser"), str(response.url)
+        timeout = parameters.get("timeout", _DEFAULT_TIMEOUT)
+        user_headers = parameters.get("headers")
+        headers = {**_DEFAULT_HEADERS, **user_headers} if user_headers else _DEFAULT_HEADERS
+        return url, headers, timeout
 
-    def _extract_meta(self, url: str, headers: dict[str, str], timeout: int) -> dict[str, Any]:
-        """Extract title, meta description, and Open Graph tags."""
-        soup, final_url = self._get_soup(url, headers, timeout)
+    def _client(self) -> httpx.Client:
+        """Return the pooled HTTP client, creating it on first use."""
+        if self._http is None:
+            self._http = new_client(_DEFAULT_HEADERS, _DEFAULT_TIMEOUT)
+        return self._http
+
+    async def _aclient(self) -> httpx.AsyncClient:
+        """Return the pooled async client for the running event loop.
+
+        A client left over from another loop is closed before it is replaced.
+        """
+        loop = asyncio.get_running_loop()
+        if self._ahttp is not None and self._aloop is not loop:
+            stale, stale_loop = self._ahttp, self._aloop
+            self._ahttp = self._aloop = None
+            await close_async_client(stale, stale_loop)
+        if self._ahttp is None:
+            self._ahttp = new_async_client(_DEFAULT_HEADERS, _DEFAULT_TIMEOUT)
+            self._aloop = loop
+        return self._ahttp
+
+    def close(self) -> None:
+        """Close pooled connections. A later request opens a new client."""
+        if self._http is not None:
+            self._http.close()
+            self._http = None
+
+    async def aclose(self) -> None:
+        """Close the pooled sync and async clients."""
+        self.close()
+        if self._ahttp is not None:
+            client, loop = self._ahttp, self._aloop
+            self._ahttp = self._aloop = None
+            await close_async_client(client, loop)
+
+    def invalidate_cache(self) -> None:
+        """Forget cached responses so the next request goes to the network."""
+        if self._cache is not None:
+            self._cache.clear()
 
-        title_tag = soup.find("title")
-        title = title_tag.get_text(strip=True) if title_tag else ""
+    def _cached_get(self, url: str, headers: Mapping[str, str], timeout: int) -> httpx.Response:
+        """GET through the response cache, if one is enabled."""
+        if self._cache is None:
+            return self._get(url, headers, timeout)
+        key = ResponseCache.key(url, headers, timeout)
+        response = self._cache.get(key)
+        if response is None:
+            response = self._get(url, headers, timeout)
+            self._cache.put(key, response)
+        return response
 
-        desc_tag = soup.find("meta", attrs={"name": "description"})
-        description = desc_tag.get("content", "") if desc_tag else ""  # type: ignore[union-attr]
+    async def _acached_get(
+        self, url: str, headers: Mapping[str, str], timeout: int
+    ) -> httpx.Response:
+        """Async GET through the response cache, if one is enabled."""
+        if self._cache is None:
+            return await self._aget(url, headers, timeout)
+        key = ResponseCache.key(url, headers, timeout)
+        response = self._cache.get(key)
+        if response is None:
+            response = await self._aget(url, headers, timeout)
+            self._cache.put(key, response)
+        return response
 
-        og_tags: dict[str, str] = {}
-        for tag in soup.find_all("meta", attrs={"property": True}):
-            prop = tag.get("property", "")
+    def _get(self, url: str, headers: Mapping[str, str], timeout: int) -> httpx.Response:
+        """Stream a GET request over the pooled client, up to max_bytes of body."""
+        with self._client().stream("GET", url, headers=headers, timeout=timeout) as response:
+            _check_html(response)
+            body = bytearray()
+            for chunk in response.iter_bytes():
+                body += chunk
+                if len(body) > self._max_bytes:
+                    break
+        return _with_body(response, bytes(body), self._max_bytes)
+
+    async def _aget(self, url: str, headers: Mapping[str, str], timeout: int) -> httpx.Response:
+        """Stream a GET request over the pooled async client, up to max_bytes of body."""
+        client = await self._aclient()
+        async with client.stream("GET", url, headers=headers, timeout=timeout) as response:
+            _check_html(response)
+            body = bytearray()
+            async for chunk in response.aiter_bytes():
+                body += chunk
+                if len(body) > self._max_bytes:
+                    break
+        return _with_body(response, bytes(body), self._max_bytes)
+
+    def _extract_meta(self, response: httpx.Response, parameters: dict[str, Any]) -> dict[str, Any]:
+        """Extract title, meta description, and Open Graph tags."""
+        text = response.text
+        head_end = _head_end(text)
+        # The body is never tokenized when the head is closed explicitly.
+        soup = self._parse(text[:head_end] if head_end is not None else text, _META_TAGS)
+
+        title: str | None = None
+        description: Any = None
+        og_tags: dict[str, Any] = {}
+        # One walk over <title> and <meta> tags instead of a search per field.
+        for tag in soup.find_all(["title", "meta"]):
+            if tag.name == "title":
+                if title is None:
+                    title = tag.get_text(strip=True)
+                continue
+            if description is None and tag.get("name") == "description":
+                description = tag.get("content", "")
+            prop = tag.get("property")
             if isinstance(prop, str) and prop.startswith("og:"):
                 og_tags[prop] = tag.get("content", "")
 
         return {
-            "url": final_url,
-            "title": title,
-            "description": description,
+            "url": str(response.url),
+            "title": title or "",
+            "description": description or "",
             "og_tags": og_tags,
+            "truncated": response.extensions.get("truncated", False),
         }
 
     def _extract_elements(
-        self,
-        url: str,
-        headers: dict[str, str],
-        timeout: int,
-        selector: str,
+        self, response: httpx.Response, parameters: dict[str, Any]
     ) -> dict[str, Any]:
         """Extract elements matching a CSS selector."""
-        soup, final_url = self._get_soup(url, headers, timeout)
-        elements = soup.select(selector)
+        selector = parameters["selector"]
+        elements = _compile_selector(selector).select(self._parse(response.text))
 
         results = []
         for el in elements:
@@ -107,13 +350,23 @@ class WebScraperSkill(Skill):
                 {
                     "tag": el.name,
                     "text": el.get_text(strip=True),
-                    "attrs": dict(el.attrs),
+                    # Copy list values (e.g. class) out of the cached tree.
+                    "attrs": {
+                        k: list(v) if isinstance(v, list) else v for k, v in el.attrs.items()
+                    },
                 }
             )
 
         return {
-            "url": final_url,
+            "url": str(response.url),
             "selector": selector,
             "elements": results,
             "element_count": len(results),
+            "truncated": response.extensions.get("truncated", False),
         }
+
+    # Action name -> builder of its result from the response and parameters.
+    _ACTIONS: ClassVar[dict[str, Callable[..., dict[str, Any]]]] = {
+        "extract_meta": _extract_meta,
+        "extract_elements": _extract_elements,
+    }
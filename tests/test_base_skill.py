@@ -20,6 +20,8 @@ class TestSkill(Skill):
             a = parameters.get("a", 0)
             b = parameters.get("b", 0)
             return {"result": a + b}
+        elif action == "bad_result":
+            return ["not", "a", "dict"]  # type: ignore[return-value]
         raise ValueError(f"Unknown action: {action}")
 
 
@@ -37,6 +39,8 @@ async def test_skill_execute_success():
     assert output.result["echoed"] == "hello"
     assert output.error is None
     assert "execution_time_ms" in output.metadata
+    assert output.metadata["skill"] == "test-skill"
+    assert output.metadata["version"] == "1.0.0"
 
 
 @pytest.mark.asyncio
@@ -66,6 +70,50 @@ async def test_skill_execute_error():
     assert output.result is None
 
 
+@pytest.mark.asyncio
+async def test_skill_execute_non_dict_result():
+    """Test that a non-dict result is reported as a failure."""
+    skill = TestSkill()
+
+    output = await skill.execute(SkillInput(action="bad_result", parameters={}))
+
+    assert output.success is False
+    assert "must return a dict" in output.error
+    assert output.result is None
+
+
+@pytest.mark.asyncio
+async def test_total_skill_skips_error_wrapper():
+    """Test that skills declaring raises = False bypass error handling."""
+
+    class TotalSkill(TestSkill):
+        raises = False
+
+    skill = TotalSkill()
+
+    output = await skill.execute(SkillInput(action="add", parameters={"a": 1, "b": 2}))
+    assert output.success is True
+    assert output.result["result"] == 3
+
+    with pytest.raises(ValueError, match="Unknown action"):
+        await skill.execute(SkillInput(action="unknown", parameters={}))
+
+
+@pytest.mark.asyncio
+async def test_execute_awaits_aprocess_override():
+    """Test that execute prefers an overridden aprocess over process."""
+
+    class AsyncSkill(TestSkill):
+        async def aprocess(self, action: str, parameters: dict[str, Any]) -> dict[str, Any]:
+            return {"async": True}
+
+    output = await AsyncSkill().execute(SkillInput(action="echo", parameters={}))
+    assert output.result == {"async": True}
+
+    output = await TestSkill().execute(SkillInput(action="echo", parameters={}))
+    assert output.result == {"echoed": ""}
+
+
 def test_skill_describe():
     """Test skill metadata description."""
     skill = TestSkill()
@@ -76,6 +124,14 @@ def test_skill_describe():
     assert metadata["version"] == "1.0.0"
 
 
+def test_skill_describe_returns_fresh_dict():
+    skill = TestSkill()
+
+    skill.describe()["name"] = "mutated"
+
+    assert skill.describe()["name"] == "test-skill"
+
+
 def test_skill_input_model():
     """Test SkillInput Pydantic model."""
     input_data = SkillInput(action="test", parameters={"key": "value"})
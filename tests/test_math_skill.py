@@ -1,14 +1,17 @@
 """Tests for MathSkill."""
 
 import math
+import statistics
+from array import array
 
 import pytest
 
 from openclaw_python_skill import SkillInput
 from openclaw_python_skill.skills import MathSkill
+from openclaw_python_skill.skills.math_skill import _safe_eval
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def skill():
     return MathSkill()
 
@@ -97,6 +100,18 @@ async def test_evaluate_code_injection(skill):
     assert output.success is False
 
 
+@pytest.mark.asyncio
+async def test_evaluate_reuses_result(skill):
+    input_data = SkillInput(action="evaluate", parameters={"expression": "7 * 6 - 1"})
+    await skill.execute(input_data)
+    hits = _safe_eval.cache_info().hits
+
+    output = await skill.execute(input_data)
+
+    assert output.result["result"] == 41.0
+    assert _safe_eval.cache_info().hits == hits + 1
+
+
 @pytest.mark.asyncio
 async def test_evaluate_missing_expression(skill):
     input_data = SkillInput(action="evaluate", parameters={})
@@ -106,6 +121,31 @@ async def test_evaluate_missing_expression(skill):
     assert "expression" in output.error.lower()
 
 
+@pytest.mark.asyncio
+async def test_evaluate_batch(skill):
+    input_data = SkillInput(
+        action="evaluate_batch",
+        parameters={"expression": "x * 2 + sqrt(y)", "variables": {"x": [1, 2], "y": [4, 9]}},
+    )
+    output = await skill.execute(input_data)
+
+    assert output.success is True
+    assert output.result["results"] == [4.0, 7.0]
+    assert output.result["count"] == 2
+
+
+@pytest.mark.asyncio
+async def test_evaluate_batch_rejects_private_variable(skill):
+    input_data = SkillInput(
+        action="evaluate_batch",
+        parameters={"expression": "__builtins__", "variables": {"__builtins__": [1]}},
+    )
+    output = await skill.execute(input_data)
+
+    assert output.success is False
+    assert "invalid variable name" in output.error.lower()
+
+
 # --- convert_units ---
 
 
@@ -121,6 +161,18 @@ async def test_convert_length_m_to_km(skill):
     assert output.result["result"] == 1.5
 
 
+@pytest.mark.asyncio
+async def test_convert_length_between_non_base_units(skill):
+    input_data = SkillInput(
+        action="convert_units",
+        parameters={"value": 3, "from_unit": "ft", "to_unit": "in"},
+    )
+    output = await skill.execute(input_data)
+
+    assert output.success is True
+    assert output.result["result"] == 36.0
+
+
 @pytest.mark.asyncio
 async def test_convert_weight_kg_to_lb(skill):
     input_data = SkillInput(
@@ -181,6 +233,18 @@ async def test_convert_incompatible_units(skill):
     assert "incompatible" in output.error.lower()
 
 
+@pytest.mark.asyncio
+async def test_convert_temperature_to_length_is_incompatible(skill):
+    input_data = SkillInput(
+        action="convert_units",
+        parameters={"value": 20, "from_unit": "C", "to_unit": "m"},
+    )
+    output = await skill.execute(input_data)
+
+    assert output.success is False
+    assert "incompatible" in output.error.lower()
+
+
 @pytest.mark.asyncio
 async def test_convert_unknown_unit(skill):
     input_data = SkillInput(
@@ -205,6 +269,18 @@ async def test_convert_missing_value(skill):
     assert "value" in output.error.lower()
 
 
+@pytest.mark.asyncio
+async def test_convert_units_batch(skill):
+    input_data = SkillInput(
+        action="convert_units_batch",
+        parameters={"values": [0, 100], "from_unit": "C", "to_unit": "F"},
+    )
+    output = await skill.execute(input_data)
+
+    assert output.success is True
+    assert output.result["results"] == [32.0, 212.0]
+
+
 # --- statistics ---
 
 
@@ -225,6 +301,60 @@ async def test_statistics_summary(skill):
     assert output.result["sum"] == 15.0
 
 
+@pytest.mark.asyncio
+async def test_statistics_summary_spread(skill):
+    input_data = SkillInput(
+        action="statistics",
+        parameters={"numbers": [2, 4, 4, 4, 5, 5, 7, 9]},
+    )
+    output = await skill.execute(input_data)
+
+    assert output.success is True
+    assert output.result["variance"] == pytest.approx(4.571429)
+    assert output.result["stdev"] == pytest.approx(2.13809, rel=1e-5)
+
+
+@pytest.mark.asyncio
+async def test_statistics_summary_sum_and_mean_are_exact(skill):
+    output = await skill.execute(
+        SkillInput(action="statistics", parameters={"numbers": [0.1] * 10})
+    )
+    assert output.result["mean"] == 0.1
+    assert output.result["sum"] == 1.0
+
+    output = await skill.execute(
+        SkillInput(action="statistics", parameters={"numbers": [1e16, 1.0, -1e16, 3.0]})
+    )
+    assert output.result["mean"] == 1.0
+    assert output.result["sum"] == 4.0
+
+
+@pytest.mark.asyncio
+async def test_statistics_summary_sum_matches_sum_operation(skill):
+    for numbers in ([0.1] * 10, [1e16, 1.0, -1e16, 3.0]):
+        summary = await skill.execute(
+            SkillInput(action="statistics", parameters={"numbers": numbers})
+        )
+        single = await skill.execute(
+            SkillInput(action="statistics", parameters={"numbers": numbers, "operation": "sum"})
+        )
+        assert summary.result["sum"] == single.result["result"]
+
+
+@pytest.mark.asyncio
+async def test_statistics_large_magnitude(skill):
+    numbers = [1e308, 1e308]
+    summary = await skill.execute(SkillInput(action="statistics", parameters={"numbers": numbers}))
+    mean = await skill.execute(
+        SkillInput(action="statistics", parameters={"numbers": numbers, "operation": "mean"})
+    )
+
+    assert summary.success is True
+    assert summary.result["mean"] == 1e308
+    assert summary.result["sum"] == math.inf
+    assert mean.result["result"] == 1e308
+
+
 @pytest.mark.asyncio
 async def test_statistics_mean(skill):
     input_data = SkillInput(
@@ -238,6 +368,19 @@ async def test_statistics_mean(skill):
     assert output.result["result"] == 20.0
 
 
+@pytest.mark.asyncio
+async def test_statistics_accepts_array(skill):
+    input_data = SkillInput(
+        action="statistics",
+        parameters={"numbers": array("d", [10, 20, 30]), "operation": "mean"},
+    )
+    output = await skill.execute(input_data)
+
+    assert output.success is True
+    assert output.result["numbers"] == [10.0, 20.0, 30.0]
+    assert output.result["result"] == 20.0
+
+
 @pytest.mark.asyncio
 async def test_statistics_median(skill):
     input_data = SkillInput(
@@ -262,6 +405,48 @@ async def test_statistics_stdev(skill):
     assert output.result["result"] == pytest.approx(2.1380899, rel=1e-4)
 
 
+@pytest.mark.asyncio
+async def test_statistics_variance_matches_statistics_module(skill):
+    input_data = SkillInput(
+        action="statistics",
+        parameters={"numbers": [1.1, 2.2, 3.3], "operation": "variance"},
+    )
+    output = await skill.execute(input_data)
+
+    assert output.result["result"] == statistics.variance([1.1, 2.2, 3.3])
+
+
+@pytest.mark.asyncio
+async def test_statistics_summary_spread_matches_single_operations(skill):
+    numbers = [
+        -973664.0168902518,
+        674938.1641929199,
+        -481291.9713439847,
+        -531338.0779066072,
+        991289.6710209255,
+        -59472.98495510407,
+    ]
+    summary = await skill.execute(SkillInput(action="statistics", parameters={"numbers": numbers}))
+
+    for operation in ("variance", "stdev"):
+        single = await skill.execute(
+            SkillInput(action="statistics", parameters={"numbers": numbers, "operation": operation})
+        )
+        assert summary.result[operation] == round(single.result["result"], 6)
+
+
+@pytest.mark.asyncio
+async def test_statistics_variance_single_number(skill):
+    input_data = SkillInput(
+        action="statistics",
+        parameters={"numbers": [7], "operation": "variance"},
+    )
+    output = await skill.execute(input_data)
+
+    assert output.success is True
+    assert output.result["result"] == 0.0
+
+
 @pytest.mark.asyncio
 async def test_statistics_single_number(skill):
     input_data = SkillInput(
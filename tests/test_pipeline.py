@@ -1,5 +1,6 @@
 """Tests for SkillPipeline."""
 
+import asyncio
 from typing import Any
 
 import pytest
@@ -7,6 +8,8 @@ import pytest
 from openclaw_python_skill import (
     PipelineResult,
     Skill,
+    SkillInput,
+    SkillOutput,
     SkillPipeline,
     SkillRegistry,
 )
@@ -59,12 +62,12 @@ def registry():
     return reg
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def upper_skill():
     return UpperCaseSkill()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def word_count_skill():
     return WordCountSkill()
 
@@ -76,7 +79,7 @@ def test_empty_pipeline():
     pipeline = SkillPipeline(name="empty")
     assert len(pipeline) == 0
     assert pipeline.name == "empty"
-    assert pipeline.steps == []
+    assert pipeline.steps == ()
 
 
 def test_add_step_returns_self(upper_skill):
@@ -95,6 +98,15 @@ def test_fluent_chaining(upper_skill, word_count_skill):
     assert len(pipeline) == 2
 
 
+def test_steps_snapshot_refreshes_after_add_step(upper_skill):
+    pipeline = SkillPipeline().add_step(skill=upper_skill, action="transform")
+    first = pipeline.steps
+    assert pipeline.steps is first
+    pipeline.add_step(skill=upper_skill, action="transform")
+    assert len(pipeline.steps) == 2
+    assert len(first) == 1
+
+
 # --- Execution with direct skill instances ---
 
 
@@ -181,6 +193,21 @@ async def test_skill_name_without_registry():
     assert "registry" in result.error.lower()
 
 
+@pytest.mark.asyncio
+async def test_registry_lookup_cached_until_invalidated(registry):
+    pipeline = SkillPipeline(registry=registry).add_step(skill_name="upper", action="transform")
+    await pipeline.execute({"text": "hello"})
+
+    registry.unregister("upper")
+    result = await pipeline.execute({"text": "hello"})
+    assert result.success is True
+
+    pipeline.invalidate_cache()
+    result = await pipeline.execute({"text": "hello"})
+    assert result.success is False
+    assert result.failed_step == 0
+
+
 # --- Mapper functions ---
 
 
@@ -240,6 +267,105 @@ async def test_fail_fast(upper_skill):
     assert result.steps[1].output.success is False
 
 
+# --- Parallel groups ---
+
+
+@pytest.mark.asyncio
+async def test_parallel_group_shares_input(upper_skill, word_count_skill):
+    pipeline = (
+        SkillPipeline()
+        .add_step(skill=upper_skill, action="transform", parallel_group=1)
+        .add_step(skill=word_count_skill, action="count", parallel_group=1)
+    )
+    result = await pipeline.execute({"text": "hello world"})
+
+    assert result.success is True
+    assert result.steps[0].output.result == {"text": "HELLO WORLD"}
+    assert result.steps[1].output.result == {"word_count": 2, "text": "hello world"}
+    assert result.final_result == {"word_count": 2, "text": "hello world"}
+
+
+@pytest.mark.asyncio
+async def test_parallel_group_runs_concurrently():
+    class RendezvousSkill(Skill):
+        """Completes only once every instance has started."""
+
+        arrived = 0
+
+        def __init__(self, name: str):
+            super().__init__(name=name)
+
+        def process(self, action: str, parameters: dict[str, Any]) -> dict[str, Any]:
+            return {}
+
+        async def execute(self, skill_input: SkillInput) -> SkillOutput:
+            RendezvousSkill.arrived += 1
+            while RendezvousSkill.arrived < 2:
+                await asyncio.sleep(0)
+            return SkillOutput(success=True, result={"skill": self.name})
+
+    pipeline = (
+        SkillPipeline()
+        .add_step(skill=RendezvousSkill("a"), action="go", parallel_group=1)
+        .add_step(skill=RendezvousSkill("b"), action="go", parallel_group=1)
+    )
+    result = await asyncio.wait_for(pipeline.execute({}), timeout=1)
+
+    assert result.success is True
+    assert result.final_result == {"skill": "b"}
+
+
+@pytest.mark.asyncio
+async def test_parallel_group_max_concurrency():
+    running = 0
+    peak = 0
+
+    class SlowSkill(Skill):
+        def __init__(self):
+            super().__init__(name="slow")
+
+        def process(self, action: str, parameters: dict[str, Any]) -> dict[str, Any]:
+            return {}
+
+        async def execute(self, skill_input: SkillInput) -> SkillOutput:
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            for _ in range(3):
+                await asyncio.sleep(0)
+            running -= 1
+            return SkillOutput(success=True, result={})
+
+    pipeline = SkillPipeline(max_concurrency=2)
+    for _ in range(5):
+        pipeline.add_step(skill=SlowSkill(), action="go", parallel_group=1)
+    result = await pipeline.execute({})
+
+    assert result.success is True
+    assert peak == 2
+
+
+def test_negative_max_concurrency_raises():
+    with pytest.raises(ValueError, match="max_concurrency"):
+        SkillPipeline(max_concurrency=-1)
+
+
+@pytest.mark.asyncio
+async def test_parallel_group_failure(upper_skill):
+    pipeline = (
+        SkillPipeline()
+        .add_step(skill=FailingSkill(), action="go", parallel_group=1)
+        .add_step(skill=upper_skill, action="transform", parallel_group=1)
+        .add_step(skill=upper_skill, action="transform")
+    )
+    result = await pipeline.execute({"text": "hello"})
+
+    assert result.success is False
+    assert result.failed_step == 0
+    assert len(result.steps) == 2  # the whole group ran
+    assert result.metadata["steps_executed"] == 2
+
+
 # --- Metadata ---
 
 
@@ -297,6 +423,7 @@ def test_describe(upper_skill, word_count_skill):
     assert desc["steps"][0]["action"] == "transform"
     assert desc["steps"][0]["has_mapper"] is False
     assert desc["steps"][1]["has_mapper"] is True
+    assert desc["steps"][0]["parallel_group"] is None
 
 
 def test_describe_with_registry_names(registry):
@@ -337,6 +464,43 @@ async def test_step_with_none_result():
     assert result.success is True
 
 
+@pytest.mark.asyncio
+async def test_custom_execute_is_used():
+    class CustomExecuteSkill(Skill):
+        def __init__(self):
+            super().__init__(name="custom-execute")
+
+        def process(self, action: str, parameters: dict[str, Any]) -> dict[str, Any]:
+            raise AssertionError("process() should not be called directly")
+
+        async def execute(self, skill_input: SkillInput) -> SkillOutput:
+            return SkillOutput(success=True, result={"context": skill_input.context})
+
+    pipeline = SkillPipeline().add_step(skill=CustomExecuteSkill(), action="go")
+    result = await pipeline.execute({}, context={"user": "test"})
+
+    assert result.success is True
+    assert result.final_result == {"context": {"user": "test"}}
+
+
+@pytest.mark.asyncio
+async def test_async_process_step_is_awaited():
+    class AsyncUpperSkill(UpperCaseSkill):
+        async def aprocess(self, action: str, parameters: dict[str, Any]) -> dict[str, Any]:
+            await asyncio.sleep(0)
+            return {"text": parameters["text"].upper(), "async": True}
+
+    pipeline = (
+        SkillPipeline()
+        .add_step(skill=UpperCaseSkill(), action="transform")
+        .add_step(skill=AsyncUpperSkill(), action="transform")
+    )
+    result = await pipeline.execute({"text": "hi"})
+
+    assert result.success is True
+    assert result.final_result == {"text": "HI", "async": True}
+
+
 @pytest.mark.asyncio
 async def test_context_passed_to_steps(upper_skill):
     pipeline = SkillPipeline().add_step(skill=upper_skill, action="transform")
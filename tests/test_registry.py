@@ -72,6 +72,18 @@ def test_register_non_skill_raises(registry):
         registry.register("not a skill")
 
 
+def test_register_many(registry, alpha, beta):
+    registry.register_many([beta, alpha])
+    assert registry.skill_names() == ["alpha", "beta"]
+
+
+def test_register_many_is_all_or_nothing(registry, alpha, beta):
+    registry.register(alpha)
+    with pytest.raises(ValueError, match="already registered"):
+        registry.register_many([beta, AlphaSkill()])
+    assert registry.skill_names() == ["alpha"]
+
+
 # --- Unregistration ---
 
 
@@ -155,6 +167,18 @@ def test_skill_names_sorted(registry, alpha, beta):
     assert registry.skill_names() == ["alpha", "beta"]
 
 
+def test_listings_refresh_after_mutation(registry, alpha, beta):
+    registry.register(beta)
+    names = registry.skill_names()
+    names.append("mutated")
+    assert registry.skill_names() == ["beta"]
+    assert [meta["name"] for meta in registry.list_skills()] == ["beta"]
+
+    registry.register(alpha)
+    assert registry.skill_names() == ["alpha", "beta"]
+    assert len(registry.list_skills()) == 2
+
+
 # --- Clear / Len ---
 
 
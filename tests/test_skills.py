@@ -1,12 +1,17 @@
 """Tests for OpenClaw Python Skills."""
 
+import os
+import subprocess
+import sys
+from pathlib import Path
+
 import pytest
 
 from openclaw_python_skill import SkillInput
 from openclaw_python_skill.skills import TextAnalyzerSkill
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def skill():
     """Create a text analyzer skill instance."""
     return TextAnalyzerSkill()
@@ -22,6 +27,8 @@ async def test_text_stats(skill):
     assert output.success is True
     assert output.result["word_count"] == 4
     assert output.result["sentence_count"] == 1
+    assert output.result["char_count"] == 25
+    assert output.result["char_count_no_spaces"] == 22
     assert output.error is None
 
 
@@ -55,6 +62,19 @@ async def test_text_patterns(skill):
     assert len(output.result["urls"]) > 0
 
 
+@pytest.mark.asyncio
+async def test_text_patterns_none_found(skill):
+    """Test pattern detection on text without URLs or emails."""
+    input_data = SkillInput(action="text_patterns", parameters={"text": "a" * 20000})
+
+    output = await skill.execute(input_data)
+
+    assert output.success is True
+    assert output.result["urls"] == []
+    assert output.result["emails"] == []
+    assert output.result["patterns_found"] == 0
+
+
 @pytest.mark.asyncio
 async def test_missing_parameter(skill):
     """Test error handling for missing parameters."""
@@ -84,3 +104,23 @@ def test_skill_describe(skill):
     assert metadata["name"] == "text-analyzer"
     assert metadata["version"] == "1.0.0"
     assert metadata["description"] != ""
+
+
+def test_skill_instances_have_no_dict(skill):
+    assert not hasattr(skill, "__dict__")
+
+
+def test_skills_import_lazily():
+    """Test that importing one skill does not load the web skills' dependencies."""
+    code = (
+        "import sys\n"
+        "from openclaw_python_skill.skills import TextAnalyzerSkill\n"
+        "print('httpx' in sys.modules)"
+    )
+    src = str(Path(__file__).parent.parent / "src")
+    env = {**os.environ, "PYTHONPATH": src}
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, env=env, check=True
+    )
+
+    assert result.stdout.strip() == "False"
@@ -1,11 +1,13 @@
 """Tests for WebFetchSkill."""
 
-from unittest.mock import MagicMock, patch
+import asyncio
+from unittest.mock import AsyncMock, patch
 
+import httpx
 import pytest
 
 from openclaw_python_skill import SkillInput
-from openclaw_python_skill.skills import WebFetchSkill
+from openclaw_python_skill.skills import WebFetchSkill, web_fetch
 
 SAMPLE_HTML = """
 <html>
@@ -22,28 +24,41 @@ SAMPLE_HTML = """
 """
 
 
-def _mock_response(text: str = SAMPLE_HTML, status_code: int = 200) -> MagicMock:
-    resp = MagicMock()
-    resp.text = text
-    resp.status_code = status_code
-    resp.url = "https://example.com"
-    resp.headers = {"content-type": "text/html; charset=utf-8"}
-    return resp
+def _mock_response(text: str = SAMPLE_HTML, status_code: int = 200) -> httpx.Response:
+    return httpx.Response(
+        status_code,
+        headers={"content-type": "text/html; charset=utf-8"},
+        text=text,
+        request=httpx.Request("GET", "https://example.com"),
+    )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
+def sample_response():
+    """One response shared by the tests; skills only read from it."""
+    return _mock_response()
+
+
+@pytest.fixture(scope="module")
 def skill():
     return WebFetchSkill()
 
 
+@pytest.fixture(autouse=True)
+def aget(skill, sample_response, monkeypatch):
+    """Stand in for the shared skill's async GET; tests may reconfigure it."""
+    mock = AsyncMock(return_value=sample_response)
+    monkeypatch.setattr(skill, "_aget", mock)
+    return mock
+
+
 # --- fetch ---
 
 
 @pytest.mark.asyncio
 async def test_fetch(skill):
-    with patch.object(skill, "_get", return_value=_mock_response()):
-        input_data = SkillInput(action="fetch", parameters={"url": "https://example.com"})
-        output = await skill.execute(input_data)
+    input_data = SkillInput(action="fetch", parameters={"url": "https://example.com"})
+    output = await skill.execute(input_data)
 
     assert output.success is True
     assert output.result["status_code"] == 200
@@ -54,28 +69,88 @@ async def test_fetch(skill):
 
 
 @pytest.mark.asyncio
-async def test_fetch_custom_timeout(skill):
-    with patch.object(skill, "_get", return_value=_mock_response()) as mock_get:
-        input_data = SkillInput(
-            action="fetch", parameters={"url": "https://example.com", "timeout": 30}
-        )
-        output = await skill.execute(input_data)
+async def test_fetch_custom_timeout(skill, aget):
+    input_data = SkillInput(
+        action="fetch", parameters={"url": "https://example.com", "timeout": 30}
+    )
+    output = await skill.execute(input_data)
 
     assert output.success is True
-    mock_get.assert_called_once()
+    aget.assert_called_once()
     # Verify timeout was passed through
-    call_args = mock_get.call_args
+    call_args = aget.call_args
     assert call_args[0][2] == 30  # third positional arg is timeout
 
 
+@pytest.mark.asyncio
+async def test_fetch_many(skill, aget, sample_response):
+    def fake_get(url, headers, timeout):
+        if url.endswith("/down"):
+            raise httpx.ConnectError("Connection refused")
+        return sample_response
+
+    aget.side_effect = fake_get
+    urls = ["https://example.com/a", "https://example.com/down", "https://example.com/b"]
+    input_data = SkillInput(action="fetch_many", parameters={"urls": urls, "concurrency": 2})
+    output = await skill.execute(input_data)
+
+    assert output.success is True
+    assert aget.call_count == 3
+    assert output.result["count"] == 3
+    assert output.result["failed"] == 1
+    assert output.result["results"][0]["status_code"] == 200
+    assert output.result["results"][1]["url"] == "https://example.com/down"
+
+
+@pytest.mark.asyncio
+async def test_fetch_many_reports_invalid_urls(monkeypatch):
+    _transport_clients(monkeypatch)
+    skill = WebFetchSkill()
+    skill._http = httpx.Client(transport=httpx.MockTransport(lambda request: _mock_response()))
+    parameters = {"urls": ["https://example.com", "https://[::1", "https://example.com:x"]}
+
+    for result in (
+        skill.process("fetch_many", parameters),
+        await skill.aprocess("fetch_many", parameters),
+    ):
+        assert result["count"] == 3
+        assert result["failed"] == 2
+        assert result["results"][0]["status_code"] == 200
+        assert result["results"][1]["url"] == "https://[::1"
+        assert "error" in result["results"][2]
+    await skill.aclose()
+
+
+@pytest.mark.asyncio
+async def test_fetch_many_rejects_non_string_urls(skill, aget):
+    parameters = {"urls": ["https://example.com", None]}
+
+    with pytest.raises(ValueError, match="urls"):
+        skill.process("fetch_many", parameters)
+    with pytest.raises(ValueError, match="urls"):
+        await skill.aprocess("fetch_many", parameters)
+    aget.assert_not_called()
+
+
+@pytest.mark.parametrize("concurrency", [0, -1, True, 2.5, "4"])
+@pytest.mark.asyncio
+async def test_fetch_many_rejects_bad_concurrency(skill, aget, concurrency):
+    parameters = {"urls": ["https://example.com"], "concurrency": concurrency}
+
+    with pytest.raises(ValueError, match="concurrency"):
+        skill.process("fetch_many", parameters)
+    with pytest.raises(ValueError, match="concurrency"):
+        await skill.aprocess("fetch_many", parameters)
+    aget.assert_not_called()
+
+
 # --- extract_links ---
 
 
 @pytest.mark.asyncio
 async def test_extract_links(skill):
-    with patch.object(skill, "_get", return_value=_mock_response()):
-        input_data = SkillInput(action="extract_links", parameters={"url": "https://example.com"})
-        output = await skill.execute(input_data)
+    input_data = SkillInput(action="extract_links", parameters={"url": "https://example.com"})
+    output = await skill.execute(input_data)
 
     assert output.success is True
     assert output.result["link_count"] == 2
@@ -84,25 +159,50 @@ async def test_extract_links(skill):
 
 
 @pytest.mark.asyncio
-async def test_extract_links_no_links(skill):
-    resp = _mock_response(text="<html><body>No links here</body></html>")
-    with patch.object(skill, "_get", return_value=resp):
-        input_data = SkillInput(action="extract_links", parameters={"url": "https://example.com"})
-        output = await skill.execute(input_data)
+async def test_extract_links_no_links(skill, aget):
+    aget.return_value = _mock_response(text="<html><body>No links here</body></html>")
+    input_data = SkillInput(action="extract_links", parameters={"url": "https://example.com"})
+    output = await skill.execute(input_data)
 
     assert output.success is True
     assert output.result["link_count"] == 0
     assert output.result["links"] == []
 
 
+@pytest.mark.asyncio
+async def test_extract_links_decodes_non_ascii_href(skill, aget):
+    aget.return_value = _mock_response(text='<a href="/caf\u00e9">Caf\u00e9</a>')
+    input_data = SkillInput(action="extract_links", parameters={"url": "https://example.com"})
+    output = await skill.execute(input_data)
+
+    assert output.result["links"] == ["/caf\u00e9"]
+
+
+@pytest.mark.parametrize(
+    ("encoding", "href"),
+    [("utf16", "/a"), ("UTF_32", "/a"), ("iso-2022-jp", "/\u65e5\u672c"), ("cp037", "/a")],
+)
+@pytest.mark.asyncio
+async def test_extract_links_non_ascii_compatible_encoding(skill, aget, encoding, href):
+    aget.return_value = httpx.Response(
+        200,
+        headers={"content-type": f"text/html; charset={encoding}"},
+        content=f'<a href="{href}">Link</a>'.encode(encoding),
+        request=httpx.Request("GET", "https://example.com"),
+    )
+    input_data = SkillInput(action="extract_links", parameters={"url": "https://example.com"})
+    output = await skill.execute(input_data)
+
+    assert output.result["links"] == [href]
+
+
 # --- extract_text ---
 
 
 @pytest.mark.asyncio
 async def test_extract_text(skill):
-    with patch.object(skill, "_get", return_value=_mock_response()):
-        input_data = SkillInput(action="extract_text", parameters={"url": "https://example.com"})
-        output = await skill.execute(input_data)
+    input_data = SkillInput(action="extract_text", parameters={"url": "https://example.com"})
+    output = await skill.execute(input_data)
 
     assert output.success is True
     assert "Hello World" in output.result["text"]
@@ -115,6 +215,18 @@ async def test_extract_text(skill):
     assert output.result["text_length"] > 0
 
 
+@pytest.mark.asyncio
+async def test_extract_all(skill, aget):
+    input_data = SkillInput(action="extract_all", parameters={"url": "https://example.com"})
+    output = await skill.execute(input_data)
+
+    aget.assert_called_once()
+    assert output.result["link_count"] == 2
+    assert "/about" in output.result["links"]
+    assert "Hello World" in output.result["text"]
+    assert "var x" not in output.result["text"]
+
+
 # --- Error handling ---
 
 
@@ -137,15 +249,148 @@ async def test_unknown_action(skill):
 
 
 @pytest.mark.asyncio
-async def test_network_error(skill):
-    with patch.object(skill, "_get", side_effect=httpx.ConnectError("Connection refused")):
-        input_data = SkillInput(action="fetch", parameters={"url": "https://unreachable.test"})
-        output = await skill.execute(input_data)
+async def test_network_error(skill, aget):
+    aget.side_effect = httpx.ConnectError("Connection refused")
+    input_data = SkillInput(action="fetch", parameters={"url": "https://unreachable.test"})
+    output = await skill.execute(input_data)
 
     assert output.success is False
     assert output.error is not None
 
 
+# --- sync path ---
+
+
+def test_process_uses_sync_client(skill, sample_response):
+    with patch.object(skill, "_get", return_value=sample_response) as mock_get:
+        result = skill.process("extract_links", {"url": "https://example.com"})
+
+    mock_get.assert_called_once()
+    assert result["link_count"] == 2
+
+
+# --- connection pooling ---
+
+
+def test_client_reused_until_closed():
+    skill = WebFetchSkill()
+    with patch("httpx.Client") as client_cls:
+        skill._get("https://example.com/a", {}, 10)
+        skill._get("https://example.com/b", {}, 10)
+        assert client_cls.call_count == 1
+
+        skill.close()
+        client_cls.return_value.close.assert_called_once()
+
+        skill._get("https://example.com/c", {}, 10)
+        assert client_cls.call_count == 2
+
+
+def _transport_clients(monkeypatch) -> list[httpx.AsyncClient]:
+    """Have WebFetchSkill build MockTransport async clients; return those built."""
+    clients: list[httpx.AsyncClient] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, headers={"content-type": "text/html"}, text=SAMPLE_HTML)
+
+    def new_async_client(headers, timeout):
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler), headers=headers)
+        clients.append(client)
+        return client
+
+    monkeypatch.setattr(web_fetch, "new_async_client", new_async_client)
+    return clients
+
+
+@pytest.mark.asyncio
+async def test_async_client_reused_until_closed(monkeypatch):
+    clients = _transport_clients(monkeypatch)
+    skill = WebFetchSkill()
+
+    for url in ("https://example.com/a", "https://example.com/b"):
+        result = await skill.aprocess("fetch", {"url": url})
+        assert result["url"] == url
+        assert "<h1>Hello World</h1>" in result["content"]
+    assert len(clients) == 1
+
+    await skill.aclose()
+    assert clients[0].is_closed
+
+
+def test_async_client_closed_when_loop_changes(monkeypatch):
+    clients = _transport_clients(monkeypatch)
+    skill = WebFetchSkill()
+
+    for _ in range(3):
+        asyncio.run(skill.aprocess("fetch", {"url": "https://example.com"}))
+
+    assert [client.is_closed for client in clients] == [True, True, False]
+    asyncio.run(skill.aclose())
+    assert clients[-1].is_closed
+
+
+# --- response cache ---
+
+
+@pytest.mark.asyncio
+async def test_cache_reuses_response_until_invalidated(sample_response):
+    skill = WebFetchSkill(cache_ttl=60)
+    input_data = SkillInput(action="fetch", parameters={"url": "https://example.com"})
+
+    with patch.object(skill, "_aget", return_value=sample_response) as mock_get:
+        await skill.execute(input_data)
+        output = await skill.execute(
+            SkillInput(action="extract_links", parameters=input_data.parameters)
+        )
+        assert mock_get.call_count == 1
+        assert output.result["link_count"] == 2
+
+        skill.invalidate_cache()
+        await skill.execute(input_data)
+        assert mock_get.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_cache_disabled_by_default(skill, aget):
+    input_data = SkillInput(action="fetch", parameters={"url": "https://example.com"})
+
+    await skill.execute(input_data)
+    await skill.execute(input_data)
+
+    assert aget.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_cache_respects_no_store():
+    skill = WebFetchSkill(cache_ttl=60)
+    response = httpx.Response(
+        200,
+        headers={"cache-control": "private, no-store"},
+        text=SAMPLE_HTML,
+        request=httpx.Request("GET", "https://example.com"),
+    )
+    input_data = SkillInput(action="fetch", parameters={"url": "https://example.com"})
+
+    with patch.object(skill, "_aget", return_value=response) as mock_get:
+        await skill.execute(input_data)
+        await skill.execute(input_data)
+
+    assert mock_get.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_fetch_404_cached():
+    skill = WebFetchSkill(negative_cache_ttl=600)
+    input_data = SkillInput(action="fetch", parameters={"url": "https://example.com/gone"})
+
+    with patch.object(skill, "_aget", return_value=_mock_response(status_code=404)) as mock_get:
+        await skill.execute(input_data)
+        output = await skill.execute(input_data)
+
+    assert mock_get.call_count == 1
+    assert output.result["status_code"] == 404
+
+
 # --- describe ---
 
 
@@ -153,6 +398,3 @@ def test_describe(skill):
     meta = skill.describe()
     assert meta["name"] == "web-fetch"
     assert meta["version"] == "1.0.0"
-
-
-import httpx  # noqa: E402
@@ -1,12 +1,14 @@
 """Tests for WebScraperSkill."""
 
-from unittest.mock import MagicMock, patch
+import asyncio
+from unittest.mock import patch
 
 import httpx
 import pytest
 
 from openclaw_python_skill import SkillInput
-from openclaw_python_skill.skills import WebScraperSkill
+from openclaw_python_skill.skills import WebScraperSkill, web_scraper
+from openclaw_python_skill.skills.web_scraper import _head_end
 
 SAMPLE_HTML = """
 <html>
@@ -30,23 +32,21 @@ SAMPLE_HTML = """
 """
 
 
-def _mock_response(text: str = SAMPLE_HTML) -> MagicMock:
-    resp = MagicMock()
-    resp.text = text
-    resp.url = "https://example.com"
-    return resp
+def _mock_response(text: str = SAMPLE_HTML) -> httpx.Response:
+    return httpx.Response(
+        200,
+        headers={"content-type": "text/html; charset=utf-8"},
+        text=text,
+        request=httpx.Request("GET", "https://example.com"),
+    )
 
 
-def _mock_client_get(text: str = SAMPLE_HTML):
-    """Create a patch for httpx.Client that returns a mock response."""
-    mock_client = MagicMock()
-    mock_client.__enter__ = MagicMock(return_value=mock_client)
-    mock_client.__exit__ = MagicMock(return_value=False)
-    mock_client.get.return_value = _mock_response(text)
-    return patch("httpx.Client", return_value=mock_client)
+def _mock_aget(skill: WebScraperSkill, text: str = SAMPLE_HTML):
+    """Patch the skill's async GET to return a mock response."""
+    return patch.object(skill, "_aget", return_value=_mock_response(text))
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def skill():
     return WebScraperSkill()
 
@@ -56,7 +56,7 @@ def skill():
 
 @pytest.mark.asyncio
 async def test_extract_meta(skill):
-    with _mock_client_get():
+    with _mock_aget(skill):
         input_data = SkillInput(action="extract_meta", parameters={"url": "https://example.com"})
         output = await skill.execute(input_data)
 
@@ -71,7 +71,7 @@ async def test_extract_meta(skill):
 @pytest.mark.asyncio
 async def test_extract_meta_missing_tags(skill):
     html = "<html><head></head><body>No meta</body></html>"
-    with _mock_client_get(html):
+    with _mock_aget(skill, html):
         input_data = SkillInput(action="extract_meta", parameters={"url": "https://example.com"})
         output = await skill.execute(input_data)
 
@@ -81,12 +81,60 @@ async def test_extract_meta_missing_tags(skill):
     assert output.result["og_tags"] == {}
 
 
+@pytest.mark.asyncio
+async def test_extract_meta_reads_only_head(skill):
+    html = (
+        "<html><head><title>Head</title></head>"
+        '<body><meta property="og:title" content="Body"><title>Late</title></body></html>'
+    )
+    with _mock_aget(skill, html):
+        input_data = SkillInput(action="extract_meta", parameters={"url": "https://example.com"})
+        output = await skill.execute(input_data)
+
+    assert output.result["title"] == "Head"
+    assert output.result["og_tags"] == {}
+
+
+@pytest.mark.asyncio
+async def test_extract_meta_ignores_head_end_in_script_and_comment(skill):
+    html = (
+        '<html><head><script>document.write("</head>");</script>'
+        "<!-- </head> -->"
+        '<meta property="og:title" content="Kept"><title>Head</title></head>'
+        "<body></body></html>"
+    )
+    with _mock_aget(skill, html):
+        input_data = SkillInput(action="extract_meta", parameters={"url": "https://example.com"})
+        output = await skill.execute(input_data)
+
+    assert output.result["title"] == "Head"
+    assert output.result["og_tags"] == {"og:title": "Kept"}
+
+
+@pytest.mark.asyncio
+async def test_extract_meta_unclosed_comment_parses_whole_page(skill):
+    html = (
+        '<html><head><meta property="og:title" content="Before">'
+        "<!-- never closed <title>Hidden</title></head><body><script></body></html>"
+    )
+    assert _head_end(html) is None
+    assert _head_end("<script>" * 1000 + "</head>") is None
+
+    with _mock_aget(skill, html):
+        input_data = SkillInput(action="extract_meta", parameters={"url": "https://example.com"})
+        output = await skill.execute(input_data)
+
+    assert output.success is True
+    assert output.result["og_tags"] == {"og:title": "Before"}
+    assert output.result["title"] == ""
+
+
 # --- extract_elements ---
 
 
 @pytest.mark.asyncio
 async def test_extract_elements_by_class(skill):
-    with _mock_client_get():
+    with _mock_aget(skill):
         input_data = SkillInput(
             action="extract_elements",
             parameters={"url": "https://example.com", "selector": "p.intro"},
@@ -103,7 +151,7 @@ async def test_extract_elements_by_class(skill):
 
 @pytest.mark.asyncio
 async def test_extract_elements_nested(skill):
-    with _mock_client_get():
+    with _mock_aget(skill):
         input_data = SkillInput(
             action="extract_elements",
             parameters={"url": "https://example.com", "selector": "div.content span"},
@@ -117,7 +165,7 @@ async def test_extract_elements_nested(skill):
 
 @pytest.mark.asyncio
 async def test_extract_elements_no_match(skill):
-    with _mock_client_get():
+    with _mock_aget(skill):
         input_data = SkillInput(
             action="extract_elements",
             parameters={"url": "https://example.com", "selector": "div.nonexistent"},
@@ -131,7 +179,7 @@ async def test_extract_elements_no_match(skill):
 
 @pytest.mark.asyncio
 async def test_extract_elements_with_attrs(skill):
-    with _mock_client_get():
+    with _mock_aget(skill):
         input_data = SkillInput(
             action="extract_elements",
             parameters={"url": "https://example.com", "selector": "a.link"},
@@ -146,6 +194,39 @@ async def test_extract_elements_with_attrs(skill):
     assert el["attrs"]["href"] == "https://example.com"
 
 
+@pytest.mark.asyncio
+async def test_extract_elements_attrs_are_copies(skill):
+    params = {"url": "https://example.com", "selector": "p.intro"}
+    with _mock_aget(skill):
+        output = await skill.execute(SkillInput(action="extract_elements", parameters=params))
+        output.result["elements"][0]["attrs"]["class"].append("changed")
+        output = await skill.execute(SkillInput(action="extract_elements", parameters=params))
+
+    assert output.result["elements"][0]["attrs"]["class"] == ["intro"]
+
+
+@pytest.mark.asyncio
+async def test_selectors_share_parsed_page(skill):
+    html = "<html><head><title>Shared</title></head><body><p>Once</p></body></html>"
+    with _mock_aget(skill, html):
+        await skill.execute(
+            SkillInput(
+                action="extract_elements",
+                parameters={"url": "https://example.com", "selector": "title"},
+            )
+        )
+        hits = skill._parse.cache_info().hits
+        output = await skill.execute(
+            SkillInput(
+                action="extract_elements",
+                parameters={"url": "https://example.com", "selector": "p"},
+            )
+        )
+
+    assert output.result["elements"][0]["text"] == "Once"
+    assert skill._parse.cache_info().hits == hits + 1
+
+
 # --- Error handling ---
 
 
@@ -160,7 +241,7 @@ async def test_missing_url(skill):
 
 @pytest.mark.asyncio
 async def test_missing_selector(skill):
-    with _mock_client_get():
+    with _mock_aget(skill):
         input_data = SkillInput(
             action="extract_elements", parameters={"url": "https://example.com"}
         )
@@ -170,6 +251,20 @@ async def test_missing_selector(skill):
     assert "selector" in output.error.lower()
 
 
+@pytest.mark.asyncio
+async def test_invalid_selector_rejected_before_fetch(skill):
+    with _mock_aget(skill) as mock_get:
+        input_data = SkillInput(
+            action="extract_elements",
+            parameters={"url": "https://example.com", "selector": "p[class="},
+        )
+        output = await skill.execute(input_data)
+
+    assert output.success is False
+    assert "Invalid CSS selector" in output.error
+    mock_get.assert_not_called()
+
+
 @pytest.mark.asyncio
 async def test_unknown_action(skill):
     input_data = SkillInput(action="invalid", parameters={"url": "https://example.com"})
@@ -181,12 +276,7 @@ async def test_unknown_action(skill):
 
 @pytest.mark.asyncio
 async def test_network_error(skill):
-    mock_client = MagicMock()
-    mock_client.__enter__ = MagicMock(return_value=mock_client)
-    mock_client.__exit__ = MagicMock(return_value=False)
-    mock_client.get.side_effect = httpx.ConnectError("Connection refused")
-
-    with patch("httpx.Client", return_value=mock_client):
+    with patch.object(skill, "_aget", side_effect=httpx.ConnectError("Connection refused")):
         input_data = SkillInput(
             action="extract_meta", parameters={"url": "https://unreachable.test"}
         )
@@ -196,6 +286,117 @@ async def test_network_error(skill):
     assert output.error is not None
 
 
+# --- sync path ---
+
+
+def test_process_uses_sync_client(skill):
+    with patch.object(skill, "_get", return_value=_mock_response()) as mock_get:
+        result = skill.process("extract_meta", {"url": "https://example.com"})
+
+    mock_get.assert_called_once()
+    assert result["title"] == "Test Page Title"
+
+
+# --- streamed reads ---
+
+
+def _handler(content: bytes, content_type: str):
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, headers={"content-type": content_type}, content=content)
+
+    return handler
+
+
+def _transport_client(content: bytes, content_type: str) -> httpx.Client:
+    return httpx.Client(transport=httpx.MockTransport(_handler(content, content_type)))
+
+
+def _transport_aclients(monkeypatch, content: bytes, content_type: str) -> list[httpx.AsyncClient]:
+    """Have WebScraperSkill build MockTransport async clients; return those built."""
+    clients: list[httpx.AsyncClient] = []
+
+    def new_async_client(headers, timeout):
+        transport = httpx.MockTransport(_handler(content, content_type))
+        clients.append(httpx.AsyncClient(transport=transport, headers=headers))
+        return clients[-1]
+
+    monkeypatch.setattr(web_scraper, "new_async_client", new_async_client)
+    return clients
+
+
+def test_non_html_rejected():
+    skill = WebScraperSkill()
+    skill._http = _transport_client(b"\x89PNG", "application/octet-stream")
+
+    with pytest.raises(ValueError, match="Unsupported content type"):
+        skill.process("extract_meta", {"url": "https://example.com/file.bin"})
+
+
+def test_non_html_error_page_negative_cached():
+    skill = WebScraperSkill(negative_cache_ttl=600)
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(404, headers={"content-type": "text/plain"}, content=b"Not found")
+
+    skill._http = httpx.Client(transport=httpx.MockTransport(handler))
+    for _ in range(2):
+        result = skill.process("extract_meta", {"url": "https://example.com/gone"})
+
+    assert result["title"] == ""
+    assert result["truncated"] is False
+    assert len(requests) == 1
+
+
+@pytest.mark.asyncio
+async def test_non_html_rejected_async(monkeypatch):
+    _transport_aclients(monkeypatch, b"\x89PNG", "application/octet-stream")
+    skill = WebScraperSkill()
+
+    with pytest.raises(ValueError, match="Unsupported content type"):
+        await skill.aprocess("extract_meta", {"url": "https://example.com/file.bin"})
+
+
+def test_body_cut_off_at_max_bytes():
+    skill = WebScraperSkill(max_bytes=len("<title>Kept</title>"))
+    skill._http = _transport_client(
+        b"<title>Kept</title><p>Dropped</p>", "text/html; charset=utf-8"
+    )
+
+    result = skill.process("extract_elements", {"url": "https://example.com", "selector": "p"})
+
+    assert result["element_count"] == 0
+    assert result["truncated"] is True
+    assert skill.process("extract_meta", {"url": "https://example.com"})["title"] == "Kept"
+
+
+@pytest.mark.asyncio
+async def test_body_cut_off_at_max_bytes_async(monkeypatch):
+    _transport_aclients(monkeypatch, b"<title>Kept</title><p>Dropped</p>", "text/html")
+    skill = WebScraperSkill(max_bytes=len("<title>Kept</title>"))
+    params = {"url": "https://example.com", "selector": "p"}
+
+    result = await skill.aprocess("extract_elements", params)
+
+    assert result["element_count"] == 0
+    assert result["truncated"] is True
+    assert (await skill.aprocess("extract_meta", params))["title"] == "Kept"
+    await skill.aclose()
+
+
+def test_async_client_closed_when_loop_changes(monkeypatch):
+    clients = _transport_aclients(monkeypatch, b"<title>Page</title>", "text/html")
+    skill = WebScraperSkill()
+
+    for _ in range(3):
+        asyncio.run(skill.aprocess("extract_meta", {"url": "https://example.com"}))
+
+    assert [client.is_closed for client in clients] == [True, True, False]
+    asyncio.run(skill.aclose())
+    assert clients[-1].is_closed
+
+
 # --- describe ---
 
 